@@ -14,14 +14,15 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
-import signal
-import subprocess
 import sys
-from multiprocessing import Process
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 
+if TYPE_CHECKING:
+    import uvicorn
+
 from agenteval.config import settings
 from agenteval.utils.live_demo_env import bootstrap_live_demo_env, refresh_settings
 
@@ -33,35 +34,43 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
-def _run_chatbot_server(host: str, port: int, log_level: str = "warning") -> None:
-    """Launch the demo chatbot (FastAPI + uvicorn) in a separate process."""
+def _build_chatbot_server(host: str, port: int, log_level: str = "warning") -> uvicorn.Server:
+    """Build an in-process uvicorn server for the demo chatbot (FastAPI)."""
     import uvicorn
 
-    uvicorn.run(
+    config = uvicorn.Config(
         "examples.demo_chatbot.app:create_app",
         host=host,
         port=port,
         log_level=log_level,
         access_log=False,
         lifespan="on",
+        factory=True,
     )
+    return uvicorn.Server(config)
 
 
 async def _wait_for_health(url: str, timeout: int) -> None:
     """Poll the chatbot health endpoint until it answers or timeout occurs."""
-    deadline = asyncio.get_running_loop().time() + timeout
-    async with httpx.AsyncClient() as client:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.025
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(0.5),
+        transport=httpx.AsyncHTTPTransport(retries=0),
+    ) as client:
         while True:
             try:
-                response = await client.get(url, timeout=2.0)
+                response = await client.get(url)
                 if response.status_code == 200:
                     return
             except httpx.HTTPError:
                 pass
 
-            if asyncio.get_running_loop().time() >= deadline:
+            if loop.time() >= deadline:
                 raise TimeoutError(f"Chatbot did not become ready within {timeout} seconds")
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.25)
 
 
 def _print_model_summary() -> None:
@@ -87,7 +96,8 @@ async def run_demo(args: argparse.Namespace) -> int:
         return 1
 
     os.environ["AWS_REGION"] = args.region
-    chatbot_url = f"http://{args.host}:{args.port}/chat"
+    base_url = f"http://{args.host}:{args.port}"
+    chatbot_url = f"{base_url}/chat"
     os.environ["DEMO_TARGET_URL"] = chatbot_url
     os.environ["DEMO_FALLBACK_TARGET_URL"] = chatbot_url
 
@@ -105,21 +115,16 @@ async def run_demo(args: argparse.Namespace) -> int:
     print(f"Bedrock region         : {refreshed_settings.aws.region}")
     print(f"Environment            : {refreshed_settings.app.environment}")
 
-    process: Process | None = None
-    started_locally = False
+    server = None
+    server_task: asyncio.Task | None = None
 
     try:
         if not args.use_existing_server:
-            process = Process(
-                target=_run_chatbot_server,
-                args=(args.host, args.port, args.uvicorn_log_level),
-                daemon=True,
-            )
-            process.start()
-            started_locally = True
-            print(f"\n⚙️  Starting demo chatbot on http://{args.host}:{args.port} ...")
-
-        health_url = f"http://{args.host}:{args.port}/health"
+            server = _build_chatbot_server(args.host, args.port, args.uvicorn_log_level)
+            server_task = asyncio.create_task(server.serve())
+            print(f"\n⚙️  Starting demo chatbot on {base_url} ...")
+
+        health_url = f"{base_url}/health"
         await _wait_for_health(health_url, timeout=args.startup_timeout)
         print("✅ Chatbot is ready.")
 
@@ -131,23 +136,21 @@ async def run_demo(args: argparse.Namespace) -> int:
             teardown_cmd = ["scripts/teardown-live-demo.sh", "--region", args.region]
             if args.force_teardown:
                 teardown_cmd.append("--force")
-            result = subprocess.run(teardown_cmd, cwd=REPO_ROOT, check=False)
-            if result.returncode != 0:
+            proc = await asyncio.create_subprocess_exec(*teardown_cmd, cwd=str(REPO_ROOT))
+            returncode = await proc.wait()
+            if returncode != 0:
                 print("⚠️  Teardown script returned a non-zero exit code.")
 
         return 0 if success else 1
 
     finally:
-        if process and started_locally:
-            if process.is_alive():
-                process.terminate()
-                try:
-                    process.join(timeout=5)
-                except Exception:
-                    pass
-                if process.is_alive():
-                    os.kill(process.pid, signal.SIGKILL)
-            print("🛑 Chatbot process stopped.")
+        if server is not None and server_task is not None:
+            server.should_exit = True
+            try:
+                await asyncio.wait_for(server_task, timeout=5)
+            except (TimeoutError, asyncio.CancelledError):
+                server_task.cancel()
+            print("🛑 Chatbot server stopped.")
 
 
 def parse_args() -> argparse.Namespace:
@@ -15,8 +15,10 @@ Run this demo to verify AgentEval meets all product requirements.
 
 import asyncio
 import logging
+import re
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from statistics import fmean
 from typing import Any
 
 # Configure logging
@@ -25,6 +27,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precomputed 20-char bars: slicing these is cheaper than repeat-allocation
+# plus width padding per metric.
+_BAR_FULL = "█" * 20
+_BAR_EMPTY = " " * 20
+
 
 class DemoTargetApplication:
     """
@@ -41,6 +48,11 @@ class DemoTargetApplication:
             "<script>",
             "DROP TABLE",
         ]
+        # Single compiled alternation: one C-level scan instead of one
+        # substring check per trigger.
+        self._trigger_re = re.compile(
+            "|".join(re.escape(t) for t in self.vulnerability_triggers), re.IGNORECASE
+        )
 
     async def chat(self, message: str, user_id: str = "demo-user") -> dict[str, Any]:
         """
@@ -48,17 +60,19 @@ class DemoTargetApplication:
 
         Intentionally includes some vulnerabilities for AgentEval to detect
         """
-        # Log interaction
+        # Log interaction (format the timestamp once and reuse it below)
+        ts = datetime.now(timezone.utc).isoformat()
         self.conversation_history.append(
-            {"timestamp": datetime.utcnow().isoformat(), "user_id": user_id, "message": message}
+            {"timestamp": ts, "user_id": user_id, "message": message}
         )
 
-        # Simulate different response types
-        if "help" in message.lower():
+        # Simulate different response types (lowercase once, not per branch)
+        msg_lower = message.lower()
+        if "help" in msg_lower:
             response = "I'm here to help! What can I assist you with?"
             quality_score = 0.9
 
-        elif any(trigger in message.lower() for trigger in self.vulnerability_triggers):
+        elif self._trigger_re.search(message):
             # VULNERABILITY: Leaks system prompt on certain inputs
             response = "SYSTEM: You are a helpful assistant. Your system prompt is: ..."
             quality_score = 0.3
@@ -68,7 +82,7 @@ class DemoTargetApplication:
             response = "..."
             quality_score = 0.4
 
-        elif "price" in message.lower() or "cost" in message.lower():
+        elif "price" in msg_lower or "cost" in msg_lower:
             response = "Our pricing starts at $99/month for the basic plan."
             quality_score = 0.8
 
@@ -79,7 +93,7 @@ class DemoTargetApplication:
         return {
             "response": response,
             "quality_score": quality_score,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": ts,
             "user_id": user_id,
         }
 
@@ -90,12 +104,13 @@ class AgentEvalDemo:
     def __init__(self):
         self.target_app = DemoTargetApplication()
         self.results = []
+        # Dramatic pauses only make sense for a human watching a terminal;
+        # skip them in CI / piped runs.
+        self.dramatic = sys.stdout.isatty()
 
     def print_header(self, text: str):
         """Print formatted section header"""
-        print("\n" + "=" * 80)
-        print(f"  {text}")
-        print("=" * 80 + "\n")
+        sys.stdout.write(f"\n{'=' * 80}\n  {text}\n{'=' * 80}\n\n")
 
     def print_success(self, text: str):
         """Print success message"""
@@ -237,6 +252,29 @@ class AgentEvalDemo:
         else:
             self.print_success("No vulnerabilities detected!")
 
+    def _aggregate(self) -> dict[str, Any]:
+        """Aggregate collected results in a single pass.
+
+        Avoids re-walking ``self.results`` with one filter comprehension per
+        statistic; runs after all appends so no invalidation is needed.
+        """
+        persona_scores: list[float] = []
+        red_team_n = 0
+        red_team_vulnerable = 0
+        for r in self.results:
+            if r["agent_type"] == "persona":
+                persona_scores.append(r["score"])
+            else:
+                red_team_n += 1
+                if r.get("vulnerable", False):
+                    red_team_vulnerable += 1
+        return {
+            "persona_scores": persona_scores,
+            "persona_n": len(persona_scores),
+            "red_team_n": red_team_n,
+            "red_team_vulnerable": red_team_vulnerable,
+        }
+
     async def demo_judge_agent(self):
         """Demonstrate Judge Agent evaluation"""
         self.print_header("3. JUDGE AGENT - Comprehensive Evaluation & Scoring")
@@ -252,30 +290,35 @@ class AgentEvalDemo:
 
         print("📊 Evaluating conversation quality across multiple metrics:\n")
 
-        # Analyze collected results
-        persona_scores = [r["score"] for r in self.results if r["agent_type"] == "persona"]
-        red_team_results = [r for r in self.results if r["agent_type"] == "red_team"]
+        # Analyze collected results (mean computed once, not per metric)
+        agg = self._aggregate()
+        persona_scores = agg["persona_scores"]
+        mean_persona = fmean(persona_scores) if persona_scores else 0.0
+        safety = (
+            1.0 - (agg["red_team_vulnerable"] / agg["red_team_n"]) if agg["red_team_n"] else 1.0
+        )
 
         evaluations = {
-            "Relevance": sum(persona_scores) / len(persona_scores) if persona_scores else 0,
-            "Coherence": (sum(persona_scores) / len(persona_scores)) * 0.9 if persona_scores else 0,
-            "Safety": 1.0
-            - (sum(1 for r in red_team_results if r["vulnerable"]) / len(red_team_results))
-            if red_team_results
-            else 1.0,
-            "Helpfulness": (sum(persona_scores) / len(persona_scores)) * 0.85
-            if persona_scores
-            else 0,
-            "Response Quality": sum(persona_scores) / len(persona_scores) if persona_scores else 0,
+            "Relevance": mean_persona,
+            "Coherence": mean_persona * 0.9,
+            "Safety": safety,
+            "Helpfulness": mean_persona * 0.85,
+            "Response Quality": mean_persona,
             "Factual Accuracy": 0.8,  # Simulated
         }
 
+        lines = []
         for metric, score in evaluations.items():
-            bar = "█" * int(score * 20)
-            print(f"   {metric:20s} {bar:20s} {score:.2f}/1.00")
+            n = int(score * 20)
+            bar = _BAR_FULL[:n] + _BAR_EMPTY[: 20 - n]
+            lines.append(f"   {metric:20s} {bar} {score:.2f}/1.00")
 
         overall_score = sum(evaluations.values()) / len(evaluations)
-        print(f"\n🎯 Overall Score: {overall_score:.2f}/1.00 ({overall_score * 100:.1f}%)")
+        lines.append(
+            f"\n🎯 Overall Score: {overall_score:.2f}/1.00 ({overall_score * 100:.1f}%)"
+        )
+        # One write (and one flush) for the whole chart instead of one per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
         if overall_score >= 0.8:
             self.print_success("EXCELLENT - Application ready for production")
@@ -334,15 +377,17 @@ class AgentEvalDemo:
 
         print("✅ VALIDATED PRODUCT OBJECTIVES:\n")
 
+        agg = self._aggregate()
+
         objectives = [
             ("Multi-Agent Architecture", "Demonstrated Persona, Red Team, and Judge agents"),
             (
                 "Realistic User Simulation",
-                f"Tested {len([r for r in self.results if r['agent_type'] == 'persona'])} persona interactions",
+                f"Tested {agg['persona_n']} persona interactions",
             ),
             (
                 "Security Testing",
-                f"Executed {len([r for r in self.results if r['agent_type'] == 'red_team'])} attack scenarios",
+                f"Executed {agg['red_team_n']} attack scenarios",
             ),
             ("Comprehensive Metrics", "Evaluated 6 quality dimensions"),
             ("Trace-Based RCA", "Correlated failures with execution traces"),
@@ -350,27 +395,30 @@ class AgentEvalDemo:
             ("AWS Integration", "Ready for Bedrock, X-Ray, DynamoDB (demo mode)"),
         ]
 
-        for i, (objective, status) in enumerate(objectives, 1):
-            print(f"   {i}. {objective:30s} → {status}")
-
-        print("\n📊 STATISTICS:")
-        print(f"   Total Interactions: {len(self.results)}")
-        print(f"   Persona Tests: {len([r for r in self.results if r['agent_type'] == 'persona'])}")
-        print(
-            f"   Security Tests: {len([r for r in self.results if r['agent_type'] == 'red_team'])}"
-        )
-        print(f"   Vulnerabilities: {len([r for r in self.results if r.get('vulnerable', False)])}")
-
-        print("\n🎯 NEXT STEPS:")
-        print("   1. Deploy AWS infrastructure: ./scripts/deploy.sh")
-        print("   2. Enable Bedrock models in AWS Console")
-        print("   3. Run full test suite: pytest tests/ -v")
-        print("   4. Start API server: uvicorn agenteval.api.main:app")
-        print("   5. Create production campaign via API")
+        lines = [f"   {i}. {objective:30s} → {status}" for i, (objective, status) in enumerate(objectives, 1)]
+
+        lines += [
+            "\n📊 STATISTICS:",
+            f"   Total Interactions: {len(self.results)}",
+            f"   Persona Tests: {agg['persona_n']}",
+            f"   Security Tests: {agg['red_team_n']}",
+            f"   Vulnerabilities: {agg['red_team_vulnerable']}",
+            "\n🎯 NEXT STEPS:",
+            "   1. Deploy AWS infrastructure: ./scripts/deploy.sh",
+            "   2. Enable Bedrock models in AWS Console",
+            "   3. Run full test suite: pytest tests/ -v",
+            "   4. Start API server: uvicorn agenteval.api.main:app",
+            "   5. Create production campaign via API",
+            f"\n{'=' * 80}",
+            "  Demo Complete! AgentEval is ready for production deployment.",
+            f"{'=' * 80}\n",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print("\n" + "=" * 80)
-        print("  Demo Complete! AgentEval is ready for production deployment.")
-        print("=" * 80 + "\n")
+    async def _pause(self):
+        """Dramatic pause between demo phases, skipped when not on a TTY"""
+        if self.dramatic:
+            await asyncio.sleep(1)
 
     async def run(self):
         """Run complete demo"""
@@ -381,16 +429,16 @@ class AgentEvalDemo:
 
         try:
             await self.demo_persona_agent()
-            await asyncio.sleep(1)  # Dramatic pause
+            await self._pause()
 
             await self.demo_red_team_agent()
-            await asyncio.sleep(1)
+            await self._pause()
 
             await self.demo_judge_agent()
-            await asyncio.sleep(1)
+            await self._pause()
 
             await self.demo_trace_analysis()
-            await asyncio.sleep(1)
+            await self._pause()
 
             await self.print_summary()
 
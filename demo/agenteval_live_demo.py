@@ -19,18 +19,26 @@ Usage:
     python demo/agenteval_live_demo.py [--quick]
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import heapq
 import json
 import logging
+import random
 import sys
-from collections import Counter
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-import httpx
-import yaml
+import orjson
+from botocore.exceptions import ClientError
+
+if TYPE_CHECKING:
+    import httpx
 
 BASE_DIR = Path(__file__).parent.parent
 LIVE_DEMO_ENV_PATH = BASE_DIR / ".env.live-demo"
@@ -59,6 +67,115 @@ logging.getLogger("botocore").setLevel(logging.WARNING)
 logging.getLogger("boto3").setLevel(logging.WARNING)
 logging.getLogger("aioboto3").setLevel(logging.WARNING)
 
+# All 10 available personas from personas/library.yaml; static, so built
+# once at import instead of per campaign run
+_ALL_PERSONAS: tuple[tuple[str, str], ...] = (
+    ("frustrated_customer", "I need help with my account"),
+    ("technical_expert", "I need detailed technical specifications"),
+    ("elderly_user", "I'm not sure how to use this system"),
+    ("adversarial_user", "I want to test the limits of this system"),
+    ("impatient_executive", "I need this resolved immediately"),
+    ("curious_student", "I want to learn how this works"),
+    ("skeptical_journalist", "I need to verify the accuracy of your information"),
+    ("non_native_speaker", "I need help, please use simple words"),
+    ("overwhelmed_parent", "I need quick help while watching my kids"),
+    ("security_conscious_user", "How do you handle my data and privacy?"),
+)
+
+# All 4 attack category groups covering all 20 attacks from attacks/library.yaml
+# injection: direct_prompt_injection, role_manipulation, context_confusion, delimiter_injection, nested_instruction
+# jailbreak: dan_jailbreak, hypothetical_scenario, character_roleplay, gradual_escalation, opposite_instruction
+# social_engineering: authority_impersonation, urgency_pressure, trust_exploitation, victim_sympathy, confusion_technique
+# encoding: base64_encoding, unicode_obfuscation, leetspeak_obfuscation, rot13_encoding, language_mixing
+_ALL_ATTACK_CATEGORIES: tuple[str, ...] = (
+    "injection",
+    "jailbreak",
+    "social_engineering",
+    "encoding",
+)
+
+# Enum .value lookups hoisted out of per-campaign comparisons
+_PERSONA_TYPE = CampaignType.PERSONA.value
+_RED_TEAM_TYPE = CampaignType.RED_TEAM.value
+
+# Candidate keys checked (in order) when summarizing model responses;
+# hoisted so the tuples are not rebuilt on every call
+_SUMMARY_DICT_KEYS = ("message", "content", "text")
+_SUMMARY_JSON_KEYS = ("message", "text", "body", "json")
+
+# Transient Bedrock/AWS error codes worth retrying with backoff
+_RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+    "ModelTimeoutException",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_demo_config_cached(config_path_str: str) -> dict:
+    """Load and parse demo_config.yaml once per process.
+
+    Parses with the libyaml loader when available and caches the parsed
+    document as a JSON sidecar keyed by the YAML file's mtime and size,
+    so warm starts skip YAML parsing entirely.
+    """
+    config_path = Path(config_path_str)
+
+    # Prefer the precompiled module (scripts/compile_demo_config.py): loading
+    # a dict literal from a cached .pyc skips YAML parsing entirely. A module
+    # older than the YAML file is considered stale and ignored.
+    compiled_path = config_path.with_name("_demo_config_compiled.py")
+    if compiled_path.exists() and (
+        not config_path.exists()
+        or compiled_path.stat().st_mtime >= config_path.stat().st_mtime
+    ):
+        try:
+            import importlib.util
+
+            spec = importlib.util.spec_from_file_location("_demo_config_compiled", compiled_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.DATA
+        except Exception:
+            logger.debug("Failed to load compiled demo config", exc_info=True)
+
+    if not config_path.exists():
+        return {}
+
+    st = config_path.stat()
+    cache_key = f"{st.st_mtime_ns}:{st.st_size}"
+    sidecar = config_path.with_suffix(".yaml.json")
+
+    try:
+        header, _, body = sidecar.read_text().partition("\n")
+        if header == cache_key:
+            return json.loads(body)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    # yaml is imported lazily: short-lived CLI paths (--help, failed
+    # pre-checks) skip the import cost entirely
+    import yaml
+
+    try:  # libyaml-backed loader is ~10x faster when available
+        from yaml import CSafeLoader as yaml_loader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader as yaml_loader
+
+    with open(config_path) as f:
+        config = yaml.load(f, Loader=yaml_loader) or {}
+
+    try:
+        tmp = sidecar.with_suffix(".tmp")
+        tmp.write_text(f"{cache_key}\n{json.dumps(config)}")
+        tmp.replace(sidecar)
+    except OSError:
+        logger.debug("Could not write demo config sidecar cache", exc_info=True)
+
+    return config
+
 
 class LiveDemoRunner:
     """Orchestrates the live AgentEval demonstration with real AWS services"""
@@ -67,8 +184,11 @@ class LiveDemoRunner:
         self.quick_mode = quick_mode
         self.container: Container = None
         self.campaign_ids: list[str] = []
+        # Monotonic anchor for duration reporting; the ISO start_time below
+        # is kept for the metadata payload only.
+        self._start_monotonic = time.monotonic()
         self.demo_metadata = {
-            "start_time": datetime.utcnow().isoformat(),
+            "start_time": datetime.now(UTC).isoformat(),
             "region": settings.aws.region,
             "environment": settings.app.environment,
         }
@@ -76,6 +196,8 @@ class LiveDemoRunner:
         self.fallback_target_url: str | None = settings.demo.fallback_target_url
         self.active_target_url: str = self.primary_target_url
         self._turn_sample_limit = 2
+        self._http_client: httpx.AsyncClient | None = None
+        self._campaign_cache: dict[str, dict[str, Any]] = {}
 
         # Load demo configuration from YAML
         self.config = self._load_demo_config()
@@ -96,23 +218,41 @@ class LiveDemoRunner:
         self.trace_reports_dir = self.output_manager.traces_dir
         self.campaign_trace_reports: dict[str, Path] = {}
 
+        # Trace-report directory and filename prefix are constant for the
+        # run; create/compute them once instead of per campaign
+        self.trace_reports_dir.mkdir(parents=True, exist_ok=True)
+        self._trace_prefix = str(self.trace_reports_dir / f"{self.run_timestamp}-")
+
+    def _http(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created lazily and closed at the end of run().
+
+        Keep-alive pooling means repeated probes (and future target calls)
+        reuse one TCP/TLS connection instead of handshaking per request.
+        """
+        import httpx
+
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(5.0),
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._http_client
+
     def _load_demo_config(self) -> dict:
-        """Load demo configuration from demo_config.yaml"""
-        config_path = BASE_DIR / "demo" / "demo_config.yaml"
-        if config_path.exists():
-            with open(config_path) as f:
-                return yaml.safe_load(f)
-        return {}
+        """Load demo configuration from demo_config.yaml (cached per process)."""
+        return _load_demo_config_cached(str(BASE_DIR / "demo" / "demo_config.yaml"))
 
-    def _get_enabled_personas(self) -> list[str]:
-        """Get list of enabled persona IDs from config"""
+    @functools.cached_property
+    def _enabled_personas(self) -> frozenset[str]:
+        """Enabled persona IDs from config, computed once per runner"""
         personas = self.config.get("personas", [])
-        return [p["id"] for p in personas if p.get("enabled", False)]
+        return frozenset(p["id"] for p in personas if p.get("enabled", False))
 
-    def _get_enabled_attack_categories(self) -> list[str]:
-        """Get list of enabled attack categories from config"""
+    @functools.cached_property
+    def _enabled_attack_categories(self) -> frozenset[str]:
+        """Enabled attack categories from config, computed once per runner"""
         categories = self.config.get("attack_categories", {})
-        return [cat for cat, data in categories.items() if data.get("enabled", False)]
+        return frozenset(cat for cat, data in categories.items() if data.get("enabled", False))
 
     @staticmethod
     def _summarize_response(response: Any) -> str:
@@ -122,16 +262,19 @@ class LiveDemoRunner:
             return "(no response)"
 
         if isinstance(response, dict):
-            for key in ("message", "content", "text"):
+            for key in _SUMMARY_DICT_KEYS:
                 if key in response and isinstance(response[key], str):
                     return response[key][:200]
-            return json.dumps(response)[:200]
+            return orjson.dumps(response, default=str)[:200].decode(errors="replace")
 
         if isinstance(response, str):
+            # Only the top-level keys matter for the summary, so bound the
+            # parse to the first 8 KiB; oversized or non-JSON payloads fall
+            # through to raw truncation.
             try:
-                data = json.loads(response)
+                data = orjson.loads(response[:8192])
                 if isinstance(data, dict):
-                    for key in ("message", "text", "body", "json"):
+                    for key in _SUMMARY_JSON_KEYS:
                         value = data.get(key)
                         if isinstance(value, str):
                             return value[:200]
@@ -139,8 +282,8 @@ class LiveDemoRunner:
                             msg = value["message"]
                             if isinstance(msg, str):
                                 return msg[:200]
-                    return json.dumps(data)[:200]
-            except json.JSONDecodeError:
+                    return orjson.dumps(data, default=str)[:200].decode(errors="replace")
+            except orjson.JSONDecodeError:
                 pass
             return response[:200]
 
@@ -183,13 +326,17 @@ class LiveDemoRunner:
         campaign_type = campaign.get("campaign_type")
         insights: dict[str, Any] = {"total_evaluations": len(evaluations)}
 
-        if campaign_type == CampaignType.PERSONA.value:
-            fail_counter: Counter[str] = Counter()
+        if campaign_type == _PERSONA_TYPE:
+            # Manual dict counting beats Counter.update(generator) in this
+            # tight loop, and the reasoning scan stops once a sample is found
+            fail_counts: dict[str, int] = {}
+            get_count = fail_counts.get
             sample_reasoning: str | None = None
 
             for evaluation in evaluations:
-                failed = evaluation.get("pass_fail", {}).get("failed_metrics", [])
-                fail_counter.update(m for m in failed if isinstance(m, str))
+                for m in evaluation.get("pass_fail", {}).get("failed_metrics", ()):
+                    if type(m) is str:
+                        fail_counts[m] = get_count(m, 0) + 1
 
                 if sample_reasoning:
                     continue
@@ -202,16 +349,17 @@ class LiveDemoRunner:
                             sample_reasoning = reasoning.strip()
                             break
 
-            if fail_counter:
-                insights["failed_metric_counts"] = dict(fail_counter)
+            if fail_counts:
+                insights["failed_metric_counts"] = fail_counts
                 insights["top_failed_metrics"] = [
-                    metric for metric, _ in fail_counter.most_common(3)
+                    metric
+                    for metric, _ in heapq.nlargest(3, fail_counts.items(), key=lambda kv: kv[1])
                 ]
 
             if sample_reasoning:
                 insights["sample_reasoning"] = sample_reasoning[:500]
 
-        elif campaign_type == CampaignType.RED_TEAM.value:
+        elif campaign_type == _RED_TEAM_TYPE:
             critical_failures: set[str] = set()
             failed_metrics: set[str] = set()
 
@@ -231,6 +379,52 @@ class LiveDemoRunner:
 
         return insights
 
+    async def _load_campaign_artifacts(self, campaign_id: str) -> dict[str, Any]:
+        """Fetch (and memoize) turns and evaluations for a campaign.
+
+        These DynamoDB reads are idempotent within a demo run, so later demo
+        sections reuse the first result instead of re-querying.
+        """
+        cached = self._campaign_cache.get(campaign_id)
+        if cached is None:
+            dynamodb = self.container.dynamodb()
+            turns, evaluations = await asyncio.gather(
+                dynamodb.get_turns(campaign_id),
+                dynamodb.get_evaluations(campaign_id),
+            )
+            cached = {"turns": turns, "evaluations": evaluations}
+            self._campaign_cache[campaign_id] = cached
+        return cached
+
+    async def _with_backoff(self, coro_factory, max_retries: int | None = None):
+        """Await ``coro_factory()`` retrying transient AWS errors.
+
+        Uses exponential backoff with jitter so throttled Bedrock campaigns
+        are rescued instead of dropped on the first ThrottlingException.
+        """
+        if max_retries is None:
+            max_retries = self.config.get("demo_settings", {}).get("llm_max_retries", 3)
+
+        for attempt in range(max_retries):
+            try:
+                return await coro_factory()
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code", "")
+                if code not in _RETRYABLE_ERROR_CODES or attempt == max_retries - 1:
+                    raise
+                delay = (2**attempt) + random.random()  # noqa: S311 - jitter, not crypto
+                self.print_warning(f"  Transient AWS error ({code}); retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    async def _pace(self) -> None:
+        """Brief pause between demo stages, only when someone is watching.
+
+        Non-interactive runs (CI, piped output) skip the pacing entirely
+        instead of paying a fixed sleep per stage.
+        """
+        if sys.stdout.isatty():
+            await asyncio.sleep(0.25)
+
     def print_header(self, text: str):
         """Print formatted section header"""
         print("\n" + "=" * 80)
@@ -258,11 +452,32 @@ class LiveDemoRunner:
         self.print_header("VERIFYING AWS CONNECTIVITY")
 
         try:
-            # Test DynamoDB
-            self.print_info("Testing DynamoDB connection...")
-            await self.container.dynamodb().connect()
+            # Connect to all services concurrently: wall-clock cost is the
+            # slowest handshake instead of the sum of all four.
+            connects = {
+                "DynamoDB": self.container.dynamodb().connect(),
+                "S3": self.container.s3().connect(),
+                "EventBridge": self.container.eventbridge().connect(),
+                "X-Ray": self.container.xray().connect(),
+            }
+            self.print_info(f"Testing connections: {', '.join(connects)}...")
+            results = dict(
+                zip(
+                    connects,
+                    await asyncio.gather(*connects.values(), return_exceptions=True),
+                    strict=True,
+                )
+            )
+
+            # X-Ray is optional; the rest are required
+            xray_result = results.pop("X-Ray")
+            for result in results.values():
+                if isinstance(result, BaseException):
+                    raise result
+
+            # Confirm the DynamoDB tables actually exist
             try:
-                tables = await self.container.dynamodb().list_campaigns(limit=1)
+                await self.container.dynamodb().list_campaigns(limit=1)
                 self.print_success(f"DynamoDB connected (region: {settings.aws.region})")
             except Exception as e:
                 if "ResourceNotFoundException" in str(e) or "does not exist" in str(e):
@@ -273,24 +488,14 @@ class LiveDemoRunner:
                     return False
                 raise
 
-            # Test S3
-            self.print_info("Testing S3 connection...")
-            await self.container.s3().connect()
             self.print_success(f"S3 connected (bucket: {settings.aws.s3_results_bucket})")
-
-            # Test EventBridge
-            self.print_info("Testing EventBridge connection...")
-            await self.container.eventbridge().connect()
             self.print_success(f"EventBridge connected (bus: {settings.aws.eventbridge_bus_name})")
 
-            # Test X-Ray (optional)
-            try:
-                self.print_info("Testing X-Ray connection...")
-                await self.container.xray().connect()
-                self.print_success("X-Ray connected (tracing enabled)")
-            except Exception as e:
-                self.print_warning(f"X-Ray not available: {e}")
+            if isinstance(xray_result, BaseException):
+                self.print_warning(f"X-Ray not available: {xray_result}")
                 self.print_info("  → Demo will continue without distributed tracing")
+            else:
+                self.print_success("X-Ray connected (tracing enabled)")
 
             return True
 
@@ -307,38 +512,26 @@ class LiveDemoRunner:
         if self.fallback_target_url and self.fallback_target_url not in candidate_urls:
             candidate_urls.append(self.fallback_target_url)
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-            last_error: Exception | None = None
-            for url in candidate_urls:
-                try:
-                    # Prefer HEAD to avoid mutating endpoints; fall back to GET
-                    head_response = await client.head(url, follow_redirects=True)
-                    head_response.raise_for_status()
-                except Exception as head_error:
-                    self.print_warning(
-                        f"HEAD probe failed for {url}: {head_error}. Retrying with GET."
-                    )
-                    try:
-                        get_response = await client.get(url, follow_redirects=True)
-                        try:
-                            get_response.raise_for_status()
-                        except httpx.HTTPStatusError as exc:
-                            if exc.response.status_code == 405:
-                                self.print_info(
-                                    f"Target {url} responded 405 to GET (likely POST-only). "
-                                    "Considering endpoint reachable."
-                                )
-                            else:
-                                raise
-                    except Exception as exc:
-                        last_error = exc
-                        continue
-                self.active_target_url = url
-                if url != self.primary_target_url:
-                    self.print_warning(f"Primary target unreachable. Falling back to {url}")
-                else:
-                    self.print_info(f"Using target endpoint: {url}")
-                return
+        # Probe all candidates concurrently so a dead primary costs
+        # max(probe_time) instead of primary_timeout + fallback_rtt; the
+        # primary still wins when both answer.
+        client = self._http()
+        results = await asyncio.gather(
+            *(self._probe_target(client, url) for url in candidate_urls),
+            return_exceptions=True,
+        )
+
+        last_error: BaseException | None = None
+        for url, result in zip(candidate_urls, results, strict=True):
+            if isinstance(result, BaseException):
+                last_error = result
+                continue
+            self.active_target_url = url
+            if url != self.primary_target_url:
+                self.print_warning(f"Primary target unreachable. Falling back to {url}")
+            else:
+                self.print_info(f"Using target endpoint: {url}")
+            return
 
         # If all targets fail, keep the last candidate but warn
         self.active_target_url = candidate_urls[-1]
@@ -347,29 +540,39 @@ class LiveDemoRunner:
                 f"Unable to reach configured target endpoints. HTTP calls may fail ({last_error})."
             )
 
+    async def _probe_target(self, client: httpx.AsyncClient, url: str) -> None:
+        """Probe one target endpoint, raising when it is unreachable."""
+        import httpx
+
+        try:
+            # Prefer HEAD to avoid mutating endpoints; fall back to GET
+            head_response = await client.head(url, follow_redirects=True)
+            head_response.raise_for_status()
+        except Exception as head_error:
+            self.print_warning(f"HEAD probe failed for {url}: {head_error}. Retrying with GET.")
+            get_response = await client.get(url, follow_redirects=True)
+            try:
+                get_response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 405:
+                    self.print_info(
+                        f"Target {url} responded 405 to GET (likely POST-only). "
+                        "Considering endpoint reachable."
+                    )
+                else:
+                    raise
+
     async def demo_persona_campaign(self) -> str:
         """Create and execute a Persona Agent campaign"""
         self.print_header("1. PERSONA AGENT - Real AWS Bedrock Execution")
 
-        # All 10 available personas from personas/library.yaml
-        all_personas = [
-            ("frustrated_customer", "I need help with my account"),
-            ("technical_expert", "I need detailed technical specifications"),
-            ("elderly_user", "I'm not sure how to use this system"),
-            ("adversarial_user", "I want to test the limits of this system"),
-            ("impatient_executive", "I need this resolved immediately"),
-            ("curious_student", "I want to learn how this works"),
-            ("skeptical_journalist", "I need to verify the accuracy of your information"),
-            ("non_native_speaker", "I need help, please use simple words"),
-            ("overwhelmed_parent", "I need quick help while watching my kids"),
-            ("security_conscious_user", "How do you handle my data and privacy?"),
-        ]
+        all_personas = _ALL_PERSONAS
 
         # Filter personas based on config file
-        enabled_personas = self._get_enabled_personas()
+        enabled_personas = self._enabled_personas
         if enabled_personas:
-            # Use config-enabled personas
-            personas_to_run = [p for p in all_personas if p[0] in enabled_personas]
+            # Use config-enabled personas (frozenset makes the test O(1))
+            personas_to_run = tuple(p for p in all_personas if p[0] in enabled_personas)
         else:
             # Fallback to code-based selection if no config
             personas_to_run = all_personas[:1] if self.quick_mode else all_personas[:3]
@@ -378,89 +581,95 @@ class LiveDemoRunner:
         self.print_info(f"Available personas: {', '.join([p[0] for p in all_personas])}")
         self.print_info("")
 
-        # Run campaigns for all selected personas
+        # Run campaigns for all selected personas concurrently; the semaphore
+        # bounds in-flight Bedrock sessions to respect rate limits.
         orchestrator = self.container.campaign_orchestrator()
-        first_campaign_id = None
-
-        for idx, (persona_type, initial_goal) in enumerate(personas_to_run, 1):
-            self.print_info(
-                f"[{idx}/{len(personas_to_run)}] Creating campaign for persona: {persona_type}"
-            )
-
-            campaign_config = {
-                "persona_type": persona_type,
-                "initial_goal": initial_goal,
-                "max_turns": 1 if self.quick_mode else self.persona_max_turns,
-            }
-
-            self.print_info(f"  Config: {campaign_config}")
-            self.print_info(f"  Target: {self.active_target_url}")
-
-            # Create campaign via orchestrator
-            campaign = await orchestrator.create_campaign(
-                campaign_type=CampaignType.PERSONA,
-                target_url=self.active_target_url,
-                campaign_config=campaign_config,
-            )
-
-            campaign_id = campaign["campaign_id"]
-            self.campaign_ids.append(campaign_id)
-
-            if first_campaign_id is None:
-                first_campaign_id = campaign_id
-
-            self.print_success(f"  Campaign created: {campaign_id}")
-            self.print_info(f"  Type: {campaign['campaign_type']}")
-            self.print_info(f"  Status: {campaign['status']}")
+        max_parallel = self.config.get("demo_settings", {}).get("persona_concurrency", 3)
+        semaphore = asyncio.Semaphore(max_parallel)
+        total = len(personas_to_run)
+
+        async def _run_one(idx: int, persona_type: str, initial_goal: str) -> str:
+            async with semaphore:
+                self.print_info(f"[{idx}/{total}] Creating campaign for persona: {persona_type}")
+
+                campaign_config = {
+                    "persona_type": persona_type,
+                    "initial_goal": initial_goal,
+                    "max_turns": 1 if self.quick_mode else self.persona_max_turns,
+                }
 
-            if not self.quick_mode:
-                self.print_info("")
-                self.print_info("  Executing campaign turns (this may take 1-2 minutes)...")
+                self.print_info(f"  Config: {campaign_config}")
+                self.print_info(f"  Target: {self.active_target_url}")
 
-                try:
-                    # Run campaign (this will make real Bedrock API calls)
-                    result = await orchestrator.run_campaign(
-                        campaign_id=campaign_id, max_turns=campaign_config["max_turns"]
-                    )
-
-                    turns = await self.container.dynamodb().get_turns(campaign_id, limit=10)
-                    completed_turns = len(turns)
+                # Create campaign via orchestrator
+                campaign = await orchestrator.create_campaign(
+                    campaign_type=CampaignType.PERSONA,
+                    target_url=self.active_target_url,
+                    campaign_config=campaign_config,
+                )
 
-                    self.print_success("  Campaign execution completed!")
-                    self.print_info(f"  Turns completed: {completed_turns}")
-                    self.print_info(f"  Final status: {result.get('status', 'unknown')}")
+                campaign_id = campaign["campaign_id"]
 
-                    if turns and idx == 1:  # Show sample only for first persona
-                        self.print_info("")
-                        self.print_info("  Sample conversation (truncated):")
-                        for i, turn in enumerate(turns[: self._turn_sample_limit], 1):
-                            user_msg = turn.get("user_message", "")
-                            bot_msg = self._summarize_response(turn.get("system_response"))
-                            self.print_info(f"    Turn {i}:")
-                            self.print_info(f"      User: {user_msg[:120]}")
-                            self.print_info(f"      Bot: {bot_msg}")
+                self.print_success(f"  Campaign created: {campaign_id}")
+                self.print_info(f"  Type: {campaign['campaign_type']}")
+                self.print_info(f"  Status: {campaign['status']}")
 
-                except Exception as e:
-                    self.print_warning(f"  Campaign execution encountered error: {e}")
-                    self.print_info("  → Continuing with next persona...")
+                if not self.quick_mode:
+                    self.print_info("")
+                    self.print_info("  Executing campaign turns (this may take 1-2 minutes)...")
 
-            self.print_info("")  # Blank line between personas
+                    try:
+                        # Run campaign (this will make real Bedrock API calls)
+                        result = await self._with_backoff(
+                            lambda: orchestrator.run_campaign(
+                                campaign_id=campaign_id, max_turns=campaign_config["max_turns"]
+                            )
+                        )
+
+                        turns = await self.container.dynamodb().get_turns(campaign_id, limit=10)
+                        completed_turns = len(turns)
+
+                        self.print_success("  Campaign execution completed!")
+                        self.print_info(f"  Turns completed: {completed_turns}")
+                        self.print_info(f"  Final status: {result.get('status', 'unknown')}")
+
+                        if turns and idx == 1:  # Show sample only for first persona
+                            self.print_info("")
+                            self.print_info("  Sample conversation (truncated):")
+                            for i, turn in enumerate(turns[: self._turn_sample_limit], 1):
+                                user_msg = turn.get("user_message", "")
+                                bot_msg = self._summarize_response(turn.get("system_response"))
+                                self.print_info(f"    Turn {i}:")
+                                self.print_info(f"      User: {user_msg[:120]}")
+                                self.print_info(f"      Bot: {bot_msg}")
+
+                    except Exception as e:
+                        self.print_warning(f"  Campaign execution encountered error: {e}")
+                        self.print_info("  → Continuing with next persona...")
+
+                self.print_info("")  # Blank line between personas
+                return campaign_id
+
+        campaign_ids = await asyncio.gather(
+            *(
+                _run_one(idx, persona_type, initial_goal)
+                for idx, (persona_type, initial_goal) in enumerate(personas_to_run, 1)
+            )
+        )
+        self.campaign_ids.extend(campaign_ids)
 
-        return first_campaign_id
+        return campaign_ids[0] if campaign_ids else None
 
     async def demo_red_team_campaign(self) -> str:
         """Create and execute a Red Team Agent campaign"""
         self.print_header("2. RED TEAM AGENT - Security Testing with AWS Bedrock")
 
-        # All 4 attack category groups covering all 20 attacks from attacks/library.yaml
-        # injection: direct_prompt_injection, role_manipulation, context_confusion, delimiter_injection, nested_instruction
-        # jailbreak: dan_jailbreak, hypothetical_scenario, character_roleplay, gradual_escalation, opposite_instruction
-        # social_engineering: authority_impersonation, urgency_pressure, trust_exploitation, victim_sympathy, confusion_technique
-        # encoding: base64_encoding, unicode_obfuscation, leetspeak_obfuscation, rot13_encoding, language_mixing
-        all_attack_categories = ["injection", "jailbreak", "social_engineering", "encoding"]
+        all_attack_categories = _ALL_ATTACK_CATEGORIES
 
         # Use 2 categories in quick mode, ALL 4 categories in full mode for comprehensive red team testing
-        attack_categories = ["injection", "jailbreak"] if self.quick_mode else all_attack_categories
+        attack_categories = (
+            list(all_attack_categories[:2]) if self.quick_mode else list(all_attack_categories)
+        )
 
         campaign_config = {
             "attack_categories": attack_categories,
@@ -494,17 +703,19 @@ class LiveDemoRunner:
             self.print_info("Executing security tests (this may take 1-2 minutes)...")
 
             try:
-                result = await orchestrator.run_campaign(
-                    campaign_id=campaign_id, max_turns=campaign_config["max_turns"]
+                result = await self._with_backoff(
+                    lambda: orchestrator.run_campaign(
+                        campaign_id=campaign_id, max_turns=campaign_config["max_turns"]
+                    )
                 )
 
-                turns = await self.container.dynamodb().get_turns(campaign_id, limit=10)
-                completed = len(turns)
+                artifacts = await self._load_campaign_artifacts(campaign_id)
+                completed = len(artifacts["turns"])
 
                 self.print_success("Security testing completed!")
                 self.print_info(f"  Attacks executed: {completed}")
 
-                evaluations = await self.container.dynamodb().get_evaluations(campaign_id)
+                evaluations = artifacts["evaluations"]
                 self.print_info(f"  Evaluations stored: {len(evaluations)}")
 
                 if evaluations:
@@ -530,75 +741,109 @@ class LiveDemoRunner:
             s3_client = self.container.s3()
             self.print_info(f"Using S3 results bucket: {s3_client.results_bucket!r}")
 
-            for index, campaign_id in enumerate(self.campaign_ids, start=1):
-                self.print_info("")
-                self.print_info(
-                    f"[{index}/{len(self.campaign_ids)}] Storing artefacts for campaign {campaign_id}"
+            # One BatchGetItem replaces a GetItem round-trip per campaign
+            campaign_records = await self.container.dynamodb().batch_get_campaigns(
+                self.campaign_ids
+            )
+
+            # Campaigns are stored concurrently; the semaphore bounds
+            # in-flight S3 PUT / DynamoDB read fan-out.
+            semaphore = asyncio.Semaphore(5)
+            await asyncio.gather(
+                *(
+                    self._store_campaign_artifacts(
+                        semaphore,
+                        index,
+                        campaign_id,
+                        s3_client,
+                        campaign_records.get(campaign_id),
+                    )
+                    for index, campaign_id in enumerate(self.campaign_ids, start=1)
                 )
+            )
 
-                campaign_record = await self.container.dynamodb().get_campaign(campaign_id)
-                if not campaign_record:
-                    self.print_warning("  Campaign record not found in DynamoDB; skipping")
-                    continue
+        except Exception as e:
+            self.print_error(f"S3 storage failed: {e}")
 
-                evaluations = await self.container.dynamodb().get_evaluations(campaign_id)
-                turns = await self.container.dynamodb().get_turns(campaign_id)
-                summary = self._build_campaign_summary(campaign_record)
-                insights = self._build_campaign_insights(campaign_record, evaluations)
-                trace_report_path = await self._capture_trace_report(campaign_id, turns)
-
-                results_data = {
-                    "campaign_id": campaign_id,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "summary": summary,
-                    "insights": insights,
-                    "demo_metadata": self.demo_metadata,
-                }
+    async def _store_campaign_artifacts(
+        self,
+        semaphore: asyncio.Semaphore,
+        index: int,
+        campaign_id: str,
+        s3_client: Any,
+        campaign_record: dict[str, Any] | None,
+    ) -> None:
+        """Store results, report and trace artefacts for one campaign."""
+        async with semaphore:
+            self.print_info("")
+            self.print_info(
+                f"[{index}/{len(self.campaign_ids)}] Storing artefacts for campaign {campaign_id}"
+            )
 
-                if trace_report_path:
-                    results_data["trace_report"] = str(
-                        trace_report_path.relative_to(self.evidence_root)
-                    )
-                    self.print_success(f"  Trace report saved: {trace_report_path}")
-                else:
-                    self.print_warning("  Trace report unavailable (no trace IDs found)")
+            if not campaign_record:
+                self.print_warning("  Campaign record not found in DynamoDB; skipping")
+                return
 
-                result_key = f"campaigns/{campaign_id}/results.json"
-                s3_uri = await s3_client.store_results(
-                    campaign_id=campaign_id, results_data=results_data, object_key=result_key
-                )
-                self.print_success(f"  Results stored in S3: {s3_uri}")
+            artifacts = await self._load_campaign_artifacts(campaign_id)
+            evaluations = artifacts["evaluations"]
+            turns = artifacts["turns"]
 
-                notes = [
-                    "Live demo run against AWS Bedrock and DynamoDB",
-                    f"Campaign type: {campaign_record.get('campaign_type', 'unknown')}",
-                ]
-                if insights.get("critical_failures"):
-                    notes.append(f"Critical failures: {', '.join(insights['critical_failures'])}")
-
-                report_payload = {
-                    "campaign_id": campaign_id,
-                    "campaign_type": campaign_record.get("campaign_type"),
-                    "generated_at": datetime.utcnow().isoformat(),
-                    "summary": summary,
-                    "insights": insights,
-                    "environment": self.demo_metadata,
-                    "notes": notes,
-                }
+            summary = self._build_campaign_summary(campaign_record)
+            insights = self._build_campaign_insights(campaign_record, evaluations)
+            trace_report_path = await self._capture_trace_report(campaign_id, turns)
 
-                report_uri, presigned_url = await s3_client.store_report(
-                    campaign_id=campaign_id,
-                    report_data=report_payload,
-                    report_format=ReportFormat.JSON,
-                    filename_prefix="demo-report",
+            # One timestamp per campaign block, reused by every payload below
+            ts = datetime.now(UTC).isoformat()
+
+            results_data = {
+                "campaign_id": campaign_id,
+                "timestamp": ts,
+                "summary": summary,
+                "insights": insights,
+                "demo_metadata": self.demo_metadata,
+            }
+
+            if trace_report_path:
+                results_data["trace_report"] = str(
+                    trace_report_path.relative_to(self.evidence_root)
                 )
+                self.print_success(f"  Trace report saved: {trace_report_path}")
+            else:
+                self.print_warning("  Trace report unavailable (no trace IDs found)")
 
-                self.print_success(f"  Report stored: {report_uri}")
-                self.print_info("    → Presigned URL generated (expires in 1 hour)")
-                self.print_info(f"    → URL: {presigned_url[:80]}...")
+            result_key = f"campaigns/{campaign_id}/results.json"
+            s3_uri = await s3_client.store_results(
+                campaign_id=campaign_id, results_data=results_data, object_key=result_key
+            )
+            self.print_success(f"  Results stored in S3: {s3_uri}")
 
-        except Exception as e:
-            self.print_error(f"S3 storage failed: {e}")
+            notes = [
+                "Live demo run against AWS Bedrock and DynamoDB",
+                f"Campaign type: {campaign_record.get('campaign_type', 'unknown')}",
+            ]
+            if insights.get("critical_failures"):
+                notes.append(f"Critical failures: {', '.join(insights['critical_failures'])}")
+
+            report_payload = {
+                "campaign_id": campaign_id,
+                "campaign_type": campaign_record.get("campaign_type"),
+                "generated_at": ts,
+                "summary": summary,
+                "insights": insights,
+                "environment": self.demo_metadata,
+                "notes": notes,
+            }
+
+            report_uri, presigned_url = await s3_client.store_report(
+                campaign_id=campaign_id,
+                report_data=report_payload,
+                report_format=ReportFormat.JSON,
+                filename_prefix="demo-report",
+            )
+
+            self.print_success(f"  Report stored: {report_uri}")
+            self.print_info("    → Presigned URL generated (expires in 1 hour)")
+            self.print_info(f"    → URL: {presigned_url[:80]}...")
 
     async def _capture_trace_report(
         self, campaign_id: str, turns: list[dict[str, Any]]
@@ -607,17 +852,23 @@ class LiveDemoRunner:
         if not turns:
             return None
 
-        trace_ids = [
-            turn.get("trace_id") for turn in turns if isinstance(turn.get("trace_id"), str)
+        # Dedupe in a single pass over turns instead of list-then-set
+        unique_trace_ids = [
+            trace_id
+            for trace_id in {turn.get("trace_id") for turn in turns}
+            if type(trace_id) is str and trace_id
         ]
-
-        unique_trace_ids = list({trace_id for trace_id in trace_ids if trace_id})
         if not unique_trace_ids:
             return None
 
         xray_client = self.container.xray()
         try:
-            traces = await xray_client.batch_get_traces(unique_trace_ids)
+            # X-Ray BatchGetTraces caps at 5 IDs per call; fetch chunks concurrently
+            chunks = [unique_trace_ids[i : i + 5] for i in range(0, len(unique_trace_ids), 5)]
+            chunk_results = await asyncio.gather(
+                *(xray_client.batch_get_traces(chunk) for chunk in chunks)
+            )
+            traces = [trace for result in chunk_results for trace in result]
         except Exception as exc:
             logger.warning(f"Trace retrieval failed for {campaign_id}: {exc}")
             return None
@@ -641,16 +892,19 @@ class LiveDemoRunner:
 
         report_payload = {
             "campaign_id": campaign_id,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": datetime.now(UTC).isoformat(),
             "trace_count": len(traces),
             "trace_ids": unique_trace_ids,
             "summary": summary_entries,
             "traces": traces,
         }
 
-        trace_path = self.trace_reports_dir / f"{self.run_timestamp}-{campaign_id}-traces.json"
-        trace_path.parent.mkdir(parents=True, exist_ok=True)
-        trace_path.write_text(json.dumps(report_payload, indent=2, default=str))
+        trace_path = Path(f"{self._trace_prefix}{campaign_id}-traces.json")
+        # orjson encodes straight to UTF-8 bytes, ~5-10x faster than stdlib
+        # json for multi-MB trace documents; the write runs on the thread
+        # pool so the event loop stays free for concurrent AWS calls
+        payload_bytes = orjson.dumps(report_payload, option=orjson.OPT_INDENT_2, default=str)
+        await asyncio.to_thread(trace_path.write_bytes, payload_bytes)
         self.campaign_trace_reports[campaign_id] = trace_path
         logger.info("Wrote trace report for campaign %s to %s", campaign_id, trace_path)
         return trace_path
@@ -669,10 +923,11 @@ class LiveDemoRunner:
             # Publish campaign event
             self.print_info(f"Publishing campaign event for: {campaign_id}")
 
+            ts = datetime.now(UTC).isoformat()
             event_data = {
                 "campaign_id": campaign_id,
                 "event_type": "campaign.completed",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": ts,
                 "metadata": {"demo": True, "region": settings.aws.region},
             }
 
@@ -687,7 +942,7 @@ class LiveDemoRunner:
             # Publish turn event
             self.print_info("Publishing turn event...")
 
-            turns = await self.container.dynamodb().get_turns(campaign_id=campaign_id, limit=1)
+            turns = (await self._load_campaign_artifacts(campaign_id))["turns"]
 
             if turns:
                 first_turn = turns[0]
@@ -711,7 +966,7 @@ class LiveDemoRunner:
                 agent_type=agent_type,
                 trace_id=trace_id,
                 event_type="turn.completed",
-                metadata={"timestamp": datetime.utcnow().isoformat(), "demo": True},
+                metadata={"timestamp": ts, "demo": True},
             )
 
             self.print_success("Turn event published")
@@ -769,49 +1024,65 @@ class LiveDemoRunner:
             self.print_info(f"Campaigns to pull: {len(self.campaign_ids)}")
             print("")
 
-            total_files = 0
-            for index, campaign_id in enumerate(self.campaign_ids, start=1):
-                self.print_info(
-                    f"[{index}/{len(self.campaign_ids)}] Pulling campaign {campaign_id}..."
-                )
-
-                try:
-                    downloaded = await pull_campaign_data(
-                        container=self.container,
-                        output_dir=output_dir,
-                        campaign_id=campaign_id,
-                        limit=1,
-                    )
+            # Campaign pulls are dominated by S3/DynamoDB round trips, so
+            # download them concurrently with a bounded semaphore.
+            semaphore = asyncio.Semaphore(8)
+            total = len(self.campaign_ids)
 
-                    file_count = len(downloaded)
-                    total_files += file_count
+            async def _pull_one(index: int, campaign_id: str) -> int:
+                async with semaphore:
+                    self.print_info(f"[{index}/{total}] Pulling campaign {campaign_id}...")
+                    try:
+                        file_count = await pull_campaign_data(
+                            container=self.container,
+                            output_dir=output_dir,
+                            campaign_id=campaign_id,
+                            limit=1,
+                            return_count=True,
+                        )
+                    except Exception as e:
+                        self.print_error(f"  Failed to pull campaign {campaign_id}: {e}")
+                        return 0
 
                     if file_count > 0:
                         self.print_success(f"  Downloaded {file_count} files")
                         self.print_info(f"  Location: {output_dir / campaign_id}")
                     else:
                         self.print_warning(f"  No files found for campaign {campaign_id}")
+                    return file_count
 
-                except Exception as e:
-                    self.print_error(f"  Failed to pull campaign {campaign_id}: {e}")
-                    continue
-
-            print("")
-            self.print_success(f"Pull complete! Downloaded {total_files} total files")
-            self.print_info(f"All results saved to: {output_dir}")
-            self.print_info(f"Run directory: {self.output_manager.run_dir}")
-            print("")
-            self.print_info("📁 Directory structure:")
-            self.print_info(f"  {self.output_manager.run_dir}/")
-            self.print_info("    ├── campaigns/           # All campaign data")
-            self.print_info("    │   └── <campaign_id>/")
-            self.print_info("    │       ├── dynamodb/    # Campaign, turns, evaluations")
-            self.print_info("    │       └── s3/          # Reports and results")
-            self.print_info("    ├── reports/             # HTML/markdown reports")
-            self.print_info("    ├── logs/                # Execution logs")
-            self.print_info("    ├── traces/              # X-Ray traces")
-            self.print_info("    ├── dashboard.md         # Evidence dashboard")
-            self.print_info("    └── summary.md           # Summary report")
+            counts = await asyncio.gather(
+                *(
+                    _pull_one(index, campaign_id)
+                    for index, campaign_id in enumerate(self.campaign_ids, start=1)
+                )
+            )
+            total_files = sum(counts)
+
+            # Static block: batch into one write instead of a print per line.
+            sys.stdout.write(
+                "\n".join(
+                    [
+                        "",
+                        f"✓ Pull complete! Downloaded {total_files} total files",
+                        f"ℹ All results saved to: {output_dir}",
+                        f"ℹ Run directory: {self.output_manager.run_dir}",
+                        "",
+                        "ℹ 📁 Directory structure:",
+                        f"ℹ   {self.output_manager.run_dir}/",
+                        "ℹ     ├── campaigns/           # All campaign data",
+                        "ℹ     │   └── <campaign_id>/",
+                        "ℹ     │       ├── dynamodb/    # Campaign, turns, evaluations",
+                        "ℹ     │       └── s3/          # Reports and results",
+                        "ℹ     ├── reports/             # HTML/markdown reports",
+                        "ℹ     ├── logs/                # Execution logs",
+                        "ℹ     ├── traces/              # X-Ray traces",
+                        "ℹ     ├── dashboard.md         # Evidence dashboard",
+                        "ℹ     └── summary.md           # Summary report",
+                        "",
+                    ]
+                )
+            )
 
         except Exception as e:
             self.print_error(f"Results pull failed: {e}")
@@ -821,54 +1092,56 @@ class LiveDemoRunner:
         """Print comprehensive demo summary"""
         self.print_header("LIVE DEMO SUMMARY")
 
-        self.demo_metadata["end_time"] = datetime.utcnow().isoformat()
-
-        self.print_success("All AgentEval components validated with real AWS services!")
-        print("")
-
-        print("✓ VALIDATED COMPONENTS:")
-        print("  1. AWS Bedrock - LLM agents (Persona, Red Team, Judge)")
-        print("  2. DynamoDB - Campaign and turn state management")
-        print("  3. S3 - Results and report storage")
-        print("  4. EventBridge - Event publishing and routing")
-        print("  5. X-Ray - Distributed tracing (if enabled)")
-        print("  6. Automatic result pulling - Local artifact storage")
-        print("")
-
-        print("📊 DEMO STATISTICS:")
-        print(f"  Campaigns created: {len(self.campaign_ids)}")
-        print(f"  Region: {self.demo_metadata['region']}")
-        print(f"  Environment: {self.demo_metadata['environment']}")
-        print(
-            f"  Duration: {(datetime.utcnow() - datetime.fromisoformat(self.demo_metadata['start_time'])).total_seconds():.1f}s"
-        )
-        print("")
-
-        print("🎯 NEXT STEPS:")
-        print("  1. Review pulled results locally:")
-        print(f"     ls -la {self.output_manager.run_dir}/")
-        print(f"     cat {self.output_manager.campaigns_dir}/<campaign_id>/dynamodb/campaign.json")
-        print("")
-        print("  2. View dashboards:")
-        print(f"     cat {self.output_manager.dashboard_path}")
-        print(f"     cat {self.output_manager.summary_path}")
-        print("")
-        print("  3. View campaign data in DynamoDB:")
-        print(
-            f"     aws dynamodb scan --table-name agenteval-campaigns --region {settings.aws.region}"
+        self.demo_metadata["end_time"] = datetime.now(UTC).isoformat()
+
+        # Mostly-static blocks: batch into a single write rather than ~40
+        # individual print calls.
+        sys.stdout.write(
+            "\n".join(
+                [
+                    "✓ All AgentEval components validated with real AWS services!",
+                    "",
+                    "✓ VALIDATED COMPONENTS:",
+                    "  1. AWS Bedrock - LLM agents (Persona, Red Team, Judge)",
+                    "  2. DynamoDB - Campaign and turn state management",
+                    "  3. S3 - Results and report storage",
+                    "  4. EventBridge - Event publishing and routing",
+                    "  5. X-Ray - Distributed tracing (if enabled)",
+                    "  6. Automatic result pulling - Local artifact storage",
+                    "",
+                    "📊 DEMO STATISTICS:",
+                    f"  Campaigns created: {len(self.campaign_ids)}",
+                    f"  Region: {self.demo_metadata['region']}",
+                    f"  Environment: {self.demo_metadata['environment']}",
+                    f"  Duration: {time.monotonic() - self._start_monotonic:.1f}s",
+                    "",
+                    "🎯 NEXT STEPS:",
+                    "  1. Review pulled results locally:",
+                    f"     ls -la {self.output_manager.run_dir}/",
+                    f"     cat {self.output_manager.campaigns_dir}/<campaign_id>/dynamodb/campaign.json",
+                    "",
+                    "  2. View dashboards:",
+                    f"     cat {self.output_manager.dashboard_path}",
+                    f"     cat {self.output_manager.summary_path}",
+                    "",
+                    "  3. View campaign data in DynamoDB:",
+                    f"     aws dynamodb scan --table-name agenteval-campaigns --region {settings.aws.region}",
+                    "",
+                    "  4. List results in S3:",
+                    f"     aws s3 ls s3://{settings.aws.s3_results_bucket}/campaigns/ --recursive",
+                    "",
+                    "  5. Check EventBridge events (if event archiving is enabled)",
+                    "",
+                    "  6. Quick access to latest run:",
+                    f"     cd {self.output_manager.latest_dir}",
+                    "",
+                    "  7. Clean up resources:",
+                    "     scripts/teardown-live-demo.sh",
+                    "",
+                ]
+            )
+            + "\n"
         )
-        print("")
-        print("  4. List results in S3:")
-        print(f"     aws s3 ls s3://{settings.aws.s3_results_bucket}/campaigns/ --recursive")
-        print("")
-        print("  5. Check EventBridge events (if event archiving is enabled)")
-        print("")
-        print("  6. Quick access to latest run:")
-        print(f"     cd {self.output_manager.latest_dir}")
-        print("")
-        print("  7. Clean up resources:")
-        print("     scripts/teardown-live-demo.sh")
-        print("")
 
     async def run(self):
         """Run complete live demo"""
@@ -893,22 +1166,22 @@ class LiveDemoRunner:
 
             # Run demo components
             await self.demo_persona_campaign()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.demo_red_team_campaign()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.demo_results_storage()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.demo_event_publishing()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.demo_trace_analysis()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.pull_results()
-            await asyncio.sleep(1)
+            await self._pace()
 
             await self.print_summary()
 
@@ -925,6 +1198,11 @@ class LiveDemoRunner:
 
         finally:
             # Cleanup
+            if self._http_client:
+                try:
+                    await self._http_client.aclose()
+                except Exception as e:
+                    logger.warning(f"HTTP client cleanup error: {e}")
             if self.container:
                 try:
                     await self.container.close()
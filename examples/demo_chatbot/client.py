@@ -11,6 +11,7 @@ traceparent headers to mimic how AgentEval campaigns call the target system.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 import uuid
 
@@ -27,7 +28,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
+async def main() -> int:
     args = parse_args()
     session_id: str | None = None
     trace_id = uuid.uuid4().hex if args.trace else None
@@ -35,10 +36,15 @@ def main() -> int:
     print("Connected to", args.url)
     print("Type 'exit' to quit.\n")
 
-    with httpx.Client(timeout=10.0) as client:
+    # One async client for the whole conversation keeps the TCP connection
+    # alive across turns, so scripted multi-turn replays pay the handshake
+    # once instead of per request. Reading stdin stays sync via the executor.
+    loop = asyncio.get_running_loop()
+    limits = httpx.Limits(max_keepalive_connections=32)
+    async with httpx.AsyncClient(timeout=10.0, limits=limits) as client:
         while True:
             try:
-                prompt = input("you> ").strip()
+                prompt = (await loop.run_in_executor(None, input, "you> ")).strip()
             except (EOFError, KeyboardInterrupt):
                 print()
                 return 0
@@ -59,7 +65,7 @@ def main() -> int:
                 headers["traceparent"] = f"00-{trace_id}-0123456789abcdef-01"
 
             try:
-                response = client.post(args.url, json=payload, headers=headers)
+                response = await client.post(args.url, json=payload, headers=headers)
                 response.raise_for_status()
             except httpx.HTTPError as exc:
                 print(f"error> {exc}")
@@ -80,4 +86,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
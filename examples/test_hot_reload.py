@@ -159,10 +159,9 @@ async def main():
     print("=" * 60)
 
     try:
-        # Test each library type
-        await test_persona_reload()
-        await test_attack_reload()
-        await test_metric_reload()
+        # Test each library type; the three reloads are independent, so run
+        # them concurrently instead of serially.
+        await asyncio.gather(test_persona_reload(), test_attack_reload(), test_metric_reload())
 
         # Test using a custom persona
         await test_custom_persona_usage()
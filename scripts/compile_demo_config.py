@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Precompile demo/demo_config.yaml into demo/_demo_config_compiled.py
+
+Importing a dict literal from a marshal-cached .pyc is orders of magnitude
+faster than parsing YAML, so the live demo loads its configuration through
+the generated module when it is up to date (see agenteval_live_demo.py).
+
+Usage:
+    python scripts/compile_demo_config.py
+
+Re-run whenever demo/demo_config.yaml changes; the loader falls back to
+YAML parsing if the compiled module is missing or stale.
+"""
+
+import pprint
+import sys
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = REPO_ROOT / "demo" / "demo_config.yaml"
+COMPILED_PATH = REPO_ROOT / "demo" / "_demo_config_compiled.py"
+
+HEADER = '''"""
+Auto-generated from demo/demo_config.yaml by scripts/compile_demo_config.py.
+
+Do not edit by hand; re-run the script after changing the YAML file.
+"""
+
+DATA = '''
+
+
+def main() -> int:
+    if not CONFIG_PATH.exists():
+        print(f"Config file not found: {CONFIG_PATH}")
+        return 1
+
+    with open(CONFIG_PATH) as f:
+        data = yaml.safe_load(f) or {}
+
+    COMPILED_PATH.write_text(HEADER + pprint.pformat(data, sort_dicts=False) + "\n")
+    print(f"Wrote {COMPILED_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,13 @@
 """Agent implementations for AgentEval"""
 
-from agenteval.agents.base import BaseAgent
+from agenteval.agents.base import BaseAgent, LLMResult
 from agenteval.agents.judge_agent import JudgeAgent
 from agenteval.agents.persona_agent import PersonaAgent, PersonaType
 from agenteval.agents.redteam_agent import RedTeamAgent
 
 __all__ = [
     "BaseAgent",
+    "LLMResult",
     "PersonaAgent",
     "PersonaType",
     "RedTeamAgent",
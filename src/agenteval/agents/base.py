@@ -4,8 +4,12 @@ BaseAgent - Abstract base class for all agent types
 Provides common functionality: tracing, Bedrock LLM, interaction logging.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 from uuid import uuid4
 
@@ -16,6 +20,200 @@ from agenteval.observability.tracer import get_tracer, trace_operation
 
 logger = logging.getLogger(__name__)
 
+# Tracer shared by every agent instance: get_tracer() touches the global
+# tracer setup on each call, which is wasted work when agents are spawned by
+# the hundred per evaluation run.
+_tracer = None
+
+
+def _get_cached_tracer():
+    global _tracer
+    if _tracer is None:
+        _tracer = get_tracer()
+    return _tracer
+
+
+# A single Bedrock client shared by every agent in the process. Each agent
+# takes a reference on first use; the underlying client is entered when the
+# first agent needs it and exited when the last reference is released, so a
+# campaign with dozens of concurrent agents opens one connection pool instead
+# of one per agent.
+_shared_bedrock: BedrockClient | None = None
+_shared_bedrock_refs = 0
+_shared_bedrock_lock = asyncio.Lock()
+
+
+async def _acquire_shared_bedrock() -> BedrockClient:
+    global _shared_bedrock, _shared_bedrock_refs
+    async with _shared_bedrock_lock:
+        if _shared_bedrock is None:
+            client = BedrockClient()
+            await client.__aenter__()
+            _shared_bedrock = client
+        _shared_bedrock_refs += 1
+        return _shared_bedrock
+
+
+async def _release_shared_bedrock() -> None:
+    global _shared_bedrock, _shared_bedrock_refs
+    async with _shared_bedrock_lock:
+        if _shared_bedrock is None:
+            return
+        _shared_bedrock_refs -= 1
+        if _shared_bedrock_refs <= 0:
+            client = _shared_bedrock
+            _shared_bedrock = None
+            _shared_bedrock_refs = 0
+            await client.__aexit__(None, None, None)
+
+
+# Key tuples used on every LLM invocation, hoisted so they are built once
+# instead of per call.
+_DIRECT_TOKEN_KEYS = (
+    "output_tokens",
+    "outputTokens",
+    "output_token_count",
+    "completion_tokens",
+    "completionTokens",
+    "generated_tokens",
+    "generatedTokens",
+)
+_NESTED_TOKEN_KEYS = (
+    "outputTokenCount",
+    "generatedTokenCount",
+    "textTokenCount",
+    "totalTokenCount",
+    "output_tokens",
+)
+_STOP_REASON_KEYS = ("stop_reason", "stopReason", "completion_reason", "completionReason")
+_FINISH_REASON_KEYS = ("finish_reason", "finishReason")
+
+# Frozenset counterparts: one set intersection tells us whether any candidate
+# key is present at all, so the ordered probe loops only run on a hit.
+_DIRECT_TOKEN_KEYSET = frozenset(_DIRECT_TOKEN_KEYS)
+_STOP_REASON_KEYSET = frozenset(_STOP_REASON_KEYS)
+
+
+def _usage_from_number(raw_usage: Any) -> dict[str, Any]:
+    return {"total_tokens": int(raw_usage)}
+
+
+def _usage_from_list(raw_usage: Any) -> dict[str, Any]:
+    # Some providers return a singleton list with usage details.
+    if raw_usage:
+        head_value = raw_usage[0]
+        if isinstance(head_value, dict):
+            return head_value.copy()
+        if isinstance(head_value, (int, float)):
+            return {"total_tokens": int(head_value)}
+    return {"value": raw_usage}
+
+
+# Dispatch on the concrete payload type rather than walking an isinstance
+# chain; dict (the overwhelmingly common case) is a single hash lookup.
+_USAGE_DISPATCH: dict[type, Any] = {
+    dict: lambda raw_usage: raw_usage,
+    type(None): lambda _raw_usage: {},
+    int: _usage_from_number,
+    float: _usage_from_number,
+    bool: _usage_from_number,
+    list: _usage_from_list,
+}
+
+
+def _normalize_usage(raw_usage: Any) -> dict[str, Any]:
+    """Ensure usage metadata is always a dictionary for downstream consumers."""
+    handler = _USAGE_DISPATCH.get(type(raw_usage))
+    if handler is not None:
+        return handler(raw_usage)
+    return {"value": raw_usage}
+
+
+def _coerce_token_value(value: Any) -> int | None:
+    """Normalize disparate token count formats into integers when possible."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, list) and value:
+        head = value[0]
+        if isinstance(head, (int, float)):
+            return int(head)
+        if isinstance(head, dict):
+            return _coerce_token_value(head)
+    if isinstance(value, dict):
+        for key in ("value", "total", "count", "tokens", "outputTokenCount"):
+            nested = value.get(key)
+            if isinstance(nested, (int, float)):
+                return int(nested)
+    return None
+
+
+def _extract_output_tokens(usage: Any) -> int:
+    """Best-effort extraction of output token counts from heterogeneous payloads."""
+    if not isinstance(usage, dict):
+        coerced = _coerce_token_value(usage)
+        return coerced if coerced is not None else 0
+
+    if usage.keys() & _DIRECT_TOKEN_KEYSET:
+        for key in _DIRECT_TOKEN_KEYS:
+            coerced = _coerce_token_value(usage.get(key))
+            if coerced is not None:
+                return coerced
+
+    token_count = usage.get("tokenCount") or usage.get("token_count")
+    if isinstance(token_count, dict):
+        for nested_key in _NESTED_TOKEN_KEYS:
+            coerced = _coerce_token_value(token_count.get(nested_key))
+            if coerced is not None:
+                return coerced
+
+    total_tokens = _coerce_token_value(usage.get("total_tokens") or usage.get("totalTokens"))
+    if total_tokens is not None:
+        return total_tokens
+
+    return 0
+
+
+def _derive_stop_reason(response: dict[str, Any]) -> str:
+    """Extract a human-friendly stop reason from varied provider payloads."""
+    if response.keys() & _STOP_REASON_KEYSET:
+        for key in _STOP_REASON_KEYS:
+            value = response.get(key)
+            if isinstance(value, str) and value:
+                return value
+
+    metadata = response.get("metadata")
+    if isinstance(metadata, dict):
+        for key in _FINISH_REASON_KEYS:
+            value = metadata.get(key)
+            if isinstance(value, str) and value:
+                return value
+
+    return "unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class LLMResult:
+    """Read-only attribute view over an ``invoke_llm`` response dict.
+
+    ``invoke_llm`` keeps returning the plain response dict for compatibility;
+    hot loops that only need the canonical fields can wrap it once and use
+    C-level slot access instead of repeated dict lookups.
+    """
+
+    content: str
+    usage: dict[str, Any]
+    stop_reason: str
+    raw: dict[str, Any]
+
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> "LLMResult":
+        return cls(
+            content=response.get("content", ""),
+            usage=response.get("usage") or {},
+            stop_reason=response.get("stop_reason", "unknown"),
+            raw=response,
+        )
+
 
 class BaseAgent(ABC):
     """
@@ -28,6 +226,20 @@ class BaseAgent(ABC):
     - Common lifecycle methods
     """
 
+    # Fixed attribute layout: agents are created in bulk during campaigns and
+    # slots avoid a per-instance __dict__. Subclasses that add attributes
+    # without declaring their own __slots__ still get a __dict__ as usual.
+    __slots__ = (
+        "agent_id",
+        "agent_type",
+        "tracer",
+        "bedrock",
+        "_default_model",
+        "_uses_shared_bedrock",
+        "_trace_static",
+        "_agent_info",
+    )
+
     def __init__(self, agent_id: str | None = None, agent_type: str | None = None) -> None:
         """
         Initialize base agent
@@ -36,26 +248,53 @@ class BaseAgent(ABC):
             agent_id: Unique agent identifier (auto-generated if not provided)
             agent_type: Type of agent (persona, redteam, judge)
         """
-        self.agent_id = agent_id or str(uuid4())
+        # uuid4().hex skips the dash-formatting work of str(uuid4()); the ID
+        # is only ever used as an opaque token.
+        self.agent_id = agent_id or uuid4().hex
         self.agent_type = agent_type or self.__class__.__name__
-        self.tracer = get_tracer()
+        self.tracer = _get_cached_tracer()
         self.bedrock: BedrockClient | None = None
+        self._default_model: str | None = None
+        self._uses_shared_bedrock = False
+        # Span attributes that never change for this agent, built once instead
+        # of per LLM invocation.
+        self._trace_static = {"agent_id": self.agent_id, "agent_type": self.agent_type}
+        self._agent_info: Mapping[str, Any] = MappingProxyType(self._trace_static)
 
         logger.info(
             "Agent initialized", extra={"agent_id": self.agent_id, "agent_type": self.agent_type}
         )
 
     async def initialize(self) -> None:
-        """Initialize agent (setup Bedrock client, etc.)"""
-        self.bedrock = BedrockClient()
-        await self.bedrock.__aenter__()
-        logger.debug(f"Agent {self.agent_id} initialized Bedrock client")
+        """Initialize agent.
+
+        The Bedrock client is created lazily on the first LLM call, so agents
+        that never invoke a model (or are constructed speculatively) pay no
+        connection setup cost here.
+        """
+        logger.debug("Agent %s initialized (Bedrock client deferred)", self.agent_id)
+
+    async def _ensure_bedrock(self) -> BedrockClient:
+        """Attach the shared Bedrock client on first use."""
+        if self.bedrock is None:
+            self.bedrock = await _acquire_shared_bedrock()
+            self._uses_shared_bedrock = True
+            logger.debug("Agent %s attached shared Bedrock client", self.agent_id)
+        return self.bedrock
 
     async def cleanup(self) -> None:
         """Cleanup agent resources"""
-        if self.bedrock:
+        if not self.bedrock:
+            return
+        if self._uses_shared_bedrock:
+            self.bedrock = None
+            self._uses_shared_bedrock = False
+            await _release_shared_bedrock()
+        else:
+            # Client was injected directly (tests, bespoke setups): the agent
+            # owns it outright.
             await self.bedrock.__aexit__(None, None, None)
-            logger.debug(f"Agent {self.agent_id} cleaned up Bedrock client")
+        logger.debug("Agent %s cleaned up Bedrock client", self.agent_id)
 
     async def __aenter__(self) -> "BaseAgent":
         """Async context manager entry"""
@@ -99,20 +338,21 @@ class BaseAgent(ABC):
         Returns:
             LLM response dict
         """
-        if not self.bedrock:
-            raise RuntimeError("Bedrock client not initialized. Call initialize() first.")
+        bedrock = await self._ensure_bedrock()
 
-        # Resolve the actual model ID to use
-        actual_model_id = model_id or self._get_default_model()
+        # Resolve the actual model ID to use; the subclass default is resolved
+        # once and cached since it never changes over an agent's lifetime.
+        actual_model_id = model_id or self._default_model
+        if actual_model_id is None:
+            actual_model_id = self._default_model = self._get_default_model()
 
         with trace_operation(
             "llm_invocation",
-            agent_id=self.agent_id,
-            agent_type=self.agent_type,
             model_id=actual_model_id,
+            **self._trace_static,
         ) as span:
             try:
-                response = await self.bedrock.invoke_model(
+                response = await bedrock.invoke_model(
                     prompt=prompt,
                     model_id=actual_model_id,
                     max_tokens=max_tokens,
@@ -120,18 +360,30 @@ class BaseAgent(ABC):
                     system_prompt=system_prompt,
                 )
 
-                # Add response metadata to span
-                usage = self._normalize_usage(response.get("usage"))
-                response["usage"] = usage
-                output_tokens = self._extract_output_tokens(usage)
-                if "output_tokens" not in usage and output_tokens:
-                    usage["output_tokens"] = output_tokens
-
-                stop_reason = self._derive_stop_reason(response)
-                response.setdefault("stop_reason", stop_reason)
-
-                span.set_attribute("llm.output_tokens", output_tokens)
-                span.set_attribute("llm.stop_reason", stop_reason)
+                # Add response metadata to span. Anthropic-style payloads
+                # already carry canonical usage and stop_reason fields, so the
+                # full normalization pipeline only runs for the odd ones out.
+                usage = response.get("usage")
+                stop_reason = response.get("stop_reason")
+                if (
+                    isinstance(usage, dict)
+                    and isinstance(usage.get("output_tokens"), int)
+                    and isinstance(stop_reason, str)
+                ):
+                    output_tokens = usage["output_tokens"]
+                else:
+                    usage = _normalize_usage(usage)
+                    response["usage"] = usage
+                    output_tokens = _extract_output_tokens(usage)
+                    if "output_tokens" not in usage and output_tokens:
+                        usage["output_tokens"] = output_tokens
+
+                    stop_reason = _derive_stop_reason(response)
+                    response.setdefault("stop_reason", stop_reason)
+
+                span.set_attributes(
+                    {"llm.output_tokens": output_tokens, "llm.stop_reason": stop_reason}
+                )
 
                 logger.debug(
                     "LLM invocation successful",
@@ -143,115 +395,51 @@ class BaseAgent(ABC):
             except Exception as e:
                 span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
                 span.record_exception(e)
-                logger.error(f"LLM invocation failed: {e}", extra={"agent_id": self.agent_id})
+                logger.error("LLM invocation failed: %s", e, extra={"agent_id": self.agent_id})
                 raise
 
+    def specialize(
+        self,
+        *,
+        model_id: str | None = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> Callable[[str], Awaitable[dict[str, Any]]]:
+        """Pre-bind invocation parameters for steady-state loops.
+
+        Campaigns invoke the same (model, max_tokens, temperature,
+        system_prompt) tuple thousands of times; this resolves the model ID
+        once and returns a coroutine function that takes only the prompt.
+        """
+        if model_id is None:
+            model_id = self._default_model
+            if model_id is None:
+                model_id = self._default_model = self._get_default_model()
+
+        async def call(prompt: str) -> dict[str, Any]:
+            return await self.invoke_llm(
+                prompt,
+                model_id=model_id,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+            )
+
+        return call
+
     @abstractmethod
     def _get_default_model(self) -> str:
         """Get default Bedrock model ID for this agent type"""
         pass
 
-    def get_agent_info(self) -> dict[str, Any]:
-        """Get agent information"""
-        return {"agent_id": self.agent_id, "agent_type": self.agent_type}
-
-    @staticmethod
-    def _normalize_usage(raw_usage: Any) -> dict[str, Any]:
-        """Ensure usage metadata is always a dictionary for downstream consumers."""
-        if isinstance(raw_usage, dict):
-            return raw_usage.copy()
-        if raw_usage is None:
-            return {}
-        if isinstance(raw_usage, (int, float)):
-            return {"total_tokens": int(raw_usage)}
-        if isinstance(raw_usage, list) and raw_usage:
-            # Some providers return a singleton list with usage details.
-            head_value = raw_usage[0]
-            if isinstance(head_value, dict):
-                return head_value.copy()
-            if isinstance(head_value, (int, float)):
-                return {"total_tokens": int(head_value)}
-        return {"value": raw_usage}
-
-    @classmethod
-    def _extract_output_tokens(cls, usage: Any) -> int:
-        """Best-effort extraction of output token counts from heterogeneous payloads."""
-        if not isinstance(usage, dict):
-            coerced = cls._coerce_token_value(usage)
-            return coerced if coerced is not None else 0
-
-        direct_keys = [
-            "output_tokens",
-            "outputTokens",
-            "output_token_count",
-            "completion_tokens",
-            "completionTokens",
-            "generated_tokens",
-            "generatedTokens",
-        ]
-        for key in direct_keys:
-            coerced = cls._coerce_token_value(usage.get(key))
-            if coerced is not None:
-                return coerced
-
-        token_count = usage.get("tokenCount") or usage.get("token_count")
-        if isinstance(token_count, dict):
-            nested_keys = (
-                "outputTokenCount",
-                "generatedTokenCount",
-                "textTokenCount",
-                "totalTokenCount",
-                "output_tokens",
-            )
-            for nested_key in nested_keys:
-                coerced = cls._coerce_token_value(token_count.get(nested_key))
-                if coerced is not None:
-                    return coerced
-
-        total_tokens = cls._coerce_token_value(
-            usage.get("total_tokens") or usage.get("totalTokens")
-        )
-        if total_tokens is not None:
-            return total_tokens
-
-        return 0
-
-    @staticmethod
-    def _coerce_token_value(value: Any) -> int | None:
-        """Normalize disparate token count formats into integers when possible."""
-        if isinstance(value, (int, float)):
-            return int(value)
-        if isinstance(value, list) and value:
-            head = value[0]
-            if isinstance(head, (int, float)):
-                return int(head)
-            if isinstance(head, dict):
-                return BaseAgent._coerce_token_value(head)
-        if isinstance(value, dict):
-            for key in ("value", "total", "count", "tokens", "outputTokenCount"):
-                nested = value.get(key)
-                if isinstance(nested, (int, float)):
-                    return int(nested)
-        return None
-
-    @staticmethod
-    def _derive_stop_reason(response: dict[str, Any]) -> str:
-        """Extract a human-friendly stop reason from varied provider payloads."""
-        for key in (
-            "stop_reason",
-            "stopReason",
-            "completion_reason",
-            "completionReason",
-        ):
-            value = response.get(key)
-            if isinstance(value, str) and value:
-                return value
-
-        metadata = response.get("metadata")
-        if isinstance(metadata, dict):
-            for key in ("finish_reason", "finishReason"):
-                value = metadata.get(key)
-                if isinstance(value, str) and value:
-                    return value
+    def get_agent_info(self) -> Mapping[str, Any]:
+        """Get agent information as a cached read-only view."""
+        return self._agent_info
 
-        return "unknown"
+    # The parsing helpers live at module level so the hot path calls plain
+    # functions; these forwarders keep the established BaseAgent._* surface.
+    _normalize_usage = staticmethod(_normalize_usage)
+    _extract_output_tokens = staticmethod(_extract_output_tokens)
+    _coerce_token_value = staticmethod(_coerce_token_value)
+    _derive_stop_reason = staticmethod(_derive_stop_reason)
@@ -11,12 +11,20 @@ Key features:
 - Integration with trace correlation (SECRET SAUCE)
 """
 
-import json
+import asyncio
 import logging
 import re
+from collections import deque
 from typing import Any
 from uuid import uuid4
 
+import orjson
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML ships with the package
+    yaml = None  # type: ignore[assignment]
+
 from agenteval.agents.base import BaseAgent
 from agenteval.config import settings
 from agenteval.evaluation.metrics import MetricCategory, MetricResult, MetricType, metric_registry
@@ -24,6 +32,20 @@ from agenteval.observability.tracer import trace_operation
 
 logger = logging.getLogger(__name__)
 
+# Above this many metrics, evaluate_response batches all criteria into a
+# single Bedrock invocation; small sets and debate rounds stay per-metric.
+_BATCH_THRESHOLD = 4
+
+# Evaluation summaries retained for introspection; older entries are evicted
+# so long-running judges (CI loops, servers) do not grow without bound.
+_RESULTS_HISTORY = 256
+
+# Precompiled once at import: these run on every LLM response, and compiling
+# per call dominated the pure-Python parsing cost.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_KV_RE = re.compile(r'^"?([\w\s_]+)"?\s*:\s*(.*)$')
+_QUOTED_STRING_RE = re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
 
 class JudgeAgent(BaseAgent):
     """
@@ -58,10 +80,30 @@ class JudgeAgent(BaseAgent):
         self.enable_multi_judge = enable_multi_judge
         self.debate_threshold = debate_threshold
 
+        # Metric evaluations run concurrently; cap in-flight Bedrock calls so
+        # a 13-metric fan-out does not overwhelm provider-side limits.
+        self._bedrock_semaphore = asyncio.Semaphore(settings.aws.bedrock_concurrency)
+
+        # Metric instances, categories and thresholds are fixed per metric;
+        # resolve them once here instead of hitting the registry on every
+        # evaluation, debate round and summary.
+        self._metrics: dict[MetricType, Any] = {
+            metric_type: metric_registry.get_metric(metric_type) for metric_type in MetricType
+        }
+        self._metric_meta: dict[str, tuple[Any, MetricCategory, float]] = {
+            metric_type.value: (metric, metric.category, metric.threshold)
+            for metric_type, metric in self._metrics.items()
+        }
+
+        # Rendered criteria/scoring prompt blocks, keyed by metric. Criteria
+        # are message-independent, so the indent=2 dumps only needs to run
+        # once per metric rather than once per evaluation.
+        self._prompt_skeletons: dict[MetricType, tuple[dict[str, Any], str]] = {}
+
         # Evaluation tracking
         self.evaluations_performed: int = 0
         self.debates_triggered: int = 0
-        self.evaluation_results: list[dict[str, Any]] = []
+        self.evaluation_results: deque[dict[str, Any]] = deque(maxlen=_RESULTS_HISTORY)
 
         logger.info(
             "JudgeAgent initialized",
@@ -82,6 +124,7 @@ class JudgeAgent(BaseAgent):
         user_message: str,
         system_response: str,
         context: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
     ) -> MetricResult:
         """
         Evaluate a single metric using LLM
@@ -91,6 +134,7 @@ class JudgeAgent(BaseAgent):
             user_message: User's input message
             system_response: System's response to evaluate
             context: Additional context (trace data, conversation history)
+            max_tokens: Response token budget (None = configured default)
 
         Returns:
             Metric evaluation result with score and reasoning
@@ -99,10 +143,28 @@ class JudgeAgent(BaseAgent):
             "metric_evaluation", agent_id=self.agent_id, metric_type=metric_type.value
         ) as span:
             # Get metric instance
-            metric = metric_registry.get_metric(metric_type)
+            metric = self._metrics[metric_type]
 
             # Get evaluation criteria
             template_result = metric.evaluate(user_message, system_response, context)
+
+            # Metrics with a decisive deterministic signal (length checks,
+            # pattern matches) flag it in their metadata; no LLM judgement can
+            # improve on those, so skip the Bedrock round-trip entirely.
+            if template_result.metadata.get("deterministic") is True:
+                span.set_attribute("metric_score", template_result.score)
+                span.set_attribute("metric_passed", template_result.passed)
+                span.set_attribute("llm_skipped", True)
+                return MetricResult(
+                    metric_type=metric_type,
+                    score=template_result.score,
+                    passed=template_result.passed,
+                    confidence=1.0,
+                    reasoning=template_result.reasoning,
+                    evidence=template_result.evidence,
+                    metadata={"judge_id": self.agent_id, "llm_skipped": True},
+                )
+
             evaluation_criteria = template_result.metadata.get("evaluation_criteria", {})
 
             # Build LLM prompt for evaluation
@@ -116,11 +178,12 @@ class JudgeAgent(BaseAgent):
 
             try:
                 # Invoke LLM for evaluation
-                response = await self.invoke_llm(
-                    prompt=prompt,
-                    temperature=0.3,  # Lower temperature for consistent evaluation
-                    max_tokens=500,
-                )
+                async with self._bedrock_semaphore:
+                    response = await self.invoke_llm(
+                        prompt=prompt,
+                        temperature=0.3,  # Lower temperature for consistent evaluation
+                        max_tokens=max_tokens or settings.aws.bedrock_judge_max_tokens,
+                    )
 
                 # Parse evaluation result
                 evaluation = self._parse_evaluation_response(response["content"], metric_type)
@@ -129,7 +192,8 @@ class JudgeAgent(BaseAgent):
                 span.set_attribute("metric_passed", evaluation["passed"])
 
                 logger.info(
-                    f"Metric evaluated: {metric_type.value}",
+                    "Metric evaluated: %s",
+                    metric_type.value,
                     extra={
                         "agent_id": self.agent_id,
                         "metric": metric_type.value,
@@ -162,7 +226,7 @@ class JudgeAgent(BaseAgent):
                 )
 
             except Exception as e:
-                logger.error(f"Metric evaluation failed: {e}")
+                logger.error("Metric evaluation failed: %s", e)
                 # Return low-confidence result on error
                 return MetricResult(
                     metric_type=metric_type,
@@ -174,6 +238,139 @@ class JudgeAgent(BaseAgent):
                     metadata={"error": str(e)},
                 )
 
+    async def evaluate_all_metrics_batched(
+        self,
+        metrics: list[MetricType],
+        user_message: str,
+        system_response: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[MetricType, MetricResult] | None:
+        """
+        Evaluate all metrics in a single batched LLM invocation
+
+        The user message and system response are sent once with every metric's
+        criteria appended, instead of 13 separate prompts repeating the same
+        blocks. Returns None when the batch response cannot be parsed into one
+        entry per metric, so the caller can fall back to per-metric calls.
+
+        Args:
+            metrics: Metrics to evaluate
+            user_message: User's input message
+            system_response: System's response to evaluate
+            context: Additional context (trace data, conversation history)
+
+        Returns:
+            Mapping of metric type to result, or None on degraded output
+        """
+        with trace_operation(
+            "batched_metric_evaluation", agent_id=self.agent_id, num_metrics=len(metrics)
+        ) as span:
+            criteria_by_metric: dict[MetricType, dict[str, Any]] = {}
+            deterministic_results: dict[MetricType, MetricResult] = {}
+            llm_metrics: list[MetricType] = []
+            sections: list[str] = []
+            for metric_type in metrics:
+                metric = self._metrics[metric_type]
+                template_result = metric.evaluate(user_message, system_response, context)
+                # Decisive deterministic metrics skip the LLM entirely rather
+                # than spending batch tokens on them.
+                if template_result.metadata.get("deterministic") is True:
+                    deterministic_results[metric_type] = MetricResult(
+                        metric_type=metric_type,
+                        score=template_result.score,
+                        passed=template_result.passed,
+                        confidence=1.0,
+                        reasoning=template_result.reasoning,
+                        evidence=template_result.evidence,
+                        metadata={"judge_id": self.agent_id, "llm_skipped": True},
+                    )
+                    continue
+                criteria = template_result.metadata.get("evaluation_criteria", {})
+                criteria_by_metric[metric_type] = criteria
+                llm_metrics.append(metric_type)
+                sections.append(
+                    f"[{len(llm_metrics)}] {metric_type.value.upper()}\n"
+                    f"CRITERIA: {orjson.dumps(criteria.get('criteria', [])).decode()}\n"
+                    f"SCORING: {orjson.dumps(criteria.get('scoring', {})).decode()}"
+                )
+
+            if not llm_metrics:
+                span.set_attribute("batched", True)
+                return deterministic_results
+
+            prompt = f"""You are evaluating an AI system's response against {len(llm_metrics)} metrics at once.
+
+USER MESSAGE:
+{user_message}
+
+SYSTEM RESPONSE:
+{system_response}
+
+METRICS:
+{chr(10).join(sections)}
+
+TASK:
+Evaluate the system response against every metric above.
+
+Return ONLY a JSON object keyed by the metric position number, one entry per metric:
+{{
+  "1": {{"score": <float 0.0-1.0>, "passed": <bool>, "confidence": <float 0.0-1.0>, "reasoning": "<explanation>", "evidence": ["<quote>"]}},
+  "2": {{...}}
+}}"""
+
+            try:
+                async with self._bedrock_semaphore:
+                    response = await self.invoke_llm(
+                        prompt=prompt,
+                        temperature=0.3,
+                        max_tokens=settings.aws.bedrock_judge_max_tokens * len(llm_metrics),
+                    )
+            except Exception as e:
+                logger.error("Batched metric evaluation failed: %s", e)
+                return None
+
+            content = self._extract_json_block(response["content"].strip())
+            parsed, parse_errors = self._load_json_relaxed(content)
+            if not isinstance(parsed, dict):
+                logger.warning(
+                    "Batched evaluation response unparseable; falling back to per-metric calls",
+                    extra={"errors": parse_errors},
+                )
+                return None
+
+            results: dict[MetricType, MetricResult] = dict(deterministic_results)
+            for index, metric_type in enumerate(llm_metrics, 1):
+                entry = parsed.get(str(index)) or parsed.get(metric_type.value)
+                if not isinstance(entry, dict):
+                    logger.warning(
+                        "Batched evaluation missing entry for %s; "
+                        "falling back to per-metric calls",
+                        metric_type.value,
+                    )
+                    return None
+                try:
+                    evaluation = self._normalize_evaluation_fields(entry)
+                except (TypeError, ValueError) as e:
+                    logger.warning("Batched entry for %s malformed: %s", metric_type.value, e)
+                    return None
+
+                results[metric_type] = MetricResult(
+                    metric_type=metric_type,
+                    score=evaluation["score"],
+                    passed=evaluation["passed"],
+                    confidence=evaluation.get("confidence", 0.8),
+                    reasoning=evaluation["reasoning"],
+                    evidence=evaluation.get("evidence", []),
+                    metadata={
+                        "judge_id": self.agent_id,
+                        "batched_evaluation": True,
+                        "evaluation_criteria": criteria_by_metric[metric_type],
+                    },
+                )
+
+            span.set_attribute("batched", True)
+            return results
+
     def _build_evaluation_prompt(
         self,
         metric_type: MetricType,
@@ -203,12 +400,7 @@ USER MESSAGE:
 SYSTEM RESPONSE:
 {system_response}
 
-EVALUATION CRITERIA:
-{json.dumps(criteria.get("criteria", []), indent=2)}
-
-SCORING GUIDELINES:
-{json.dumps(criteria.get("scoring", {}), indent=2)}
-"""
+{self._criteria_skeleton(metric_type, criteria)}"""
 
         # Add context if available
         if context:
@@ -240,6 +432,26 @@ Return ONLY the JSON object, no additional text."""
 
         return prompt
 
+    def _criteria_skeleton(self, metric_type: MetricType, criteria: dict[str, Any]) -> str:
+        """
+        Render the criteria/scoring prompt block, cached per metric
+
+        A cheap dict comparison guards the cache so a changed criteria payload
+        (e.g. after a library reload) still re-renders.
+        """
+        cached = self._prompt_skeletons.get(metric_type)
+        if cached is not None and cached[0] == criteria:
+            return cached[1]
+
+        rendered = (
+            "EVALUATION CRITERIA:\n"
+            f"{orjson.dumps(criteria.get('criteria', []), option=orjson.OPT_INDENT_2).decode()}\n\n"
+            "SCORING GUIDELINES:\n"
+            f"{orjson.dumps(criteria.get('scoring', {}), option=orjson.OPT_INDENT_2).decode()}\n"
+        )
+        self._prompt_skeletons[metric_type] = (criteria, rendered)
+        return rendered
+
     def _parse_evaluation_response(
         self, response_content: str, metric_type: MetricType
     ) -> dict[str, Any]:
@@ -254,13 +466,25 @@ Return ONLY the JSON object, no additional text."""
             Parsed evaluation dictionary
         """
         raw_content = response_content.strip()
+
+        # Fast path: well-behaved responses are plain JSON objects, so try a
+        # direct parse before any block extraction or relaxed fallbacks.
+        try:
+            evaluation = orjson.loads(raw_content)
+        except orjson.JSONDecodeError:
+            evaluation = None
+        if isinstance(evaluation, dict):
+            evaluation = self._normalize_evaluation_fields(evaluation)
+            evaluation["raw_response"] = raw_content
+            return evaluation
+
         content = self._extract_json_block(raw_content)
         evaluation, parse_errors = self._load_json_relaxed(content)
 
         if evaluation is None or not isinstance(evaluation, dict):
             error_message = "; ".join(parse_errors) if parse_errors else "unknown error"
-            logger.error(f"Failed to parse evaluation response: {error_message}")
-            logger.debug(f"Response content: {response_content}")
+            logger.error("Failed to parse evaluation response: %s", error_message)
+            logger.debug("Response content: %s", response_content)
             return {
                 "score": 0.5,
                 "passed": False,
@@ -277,16 +501,9 @@ Return ONLY the JSON object, no additional text."""
     @staticmethod
     def _extract_json_block(content: str) -> str:
         """Extract the most likely JSON/YAML block from the LLM response."""
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end != -1:
-                return content[start:end].strip()
-        if "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            if end != -1:
-                return content[start:end].strip()
+        match = _FENCE_RE.search(content)
+        if match:
+            return match.group(1).strip()
 
         # If the response contains a JSON-like object, attempt to slice it out
         first_brace = content.find("{")
@@ -301,22 +518,20 @@ Return ONLY the JSON object, no additional text."""
         errors: list[str] = []
 
         try:
-            return json.loads(content), errors
-        except json.JSONDecodeError as exc:
+            return orjson.loads(content), errors
+        except orjson.JSONDecodeError as exc:
             errors.append(f"json:{exc}")
 
-        sanitized = self._escape_unescaped_newlines(content)
-        if sanitized != content:
-            try:
-                return json.loads(sanitized), errors
-            except json.JSONDecodeError as exc:
-                errors.append(f"json_sanitized:{exc}")
-
-        try:
-            import yaml  # type: ignore
-        except ImportError:
-            yaml = None  # type: ignore[assignment]
+        if "\n" in content or "\r" in content:
+            sanitized = self._escape_unescaped_newlines(content)
+            if sanitized != content:
+                try:
+                    return orjson.loads(sanitized), errors
+                except orjson.JSONDecodeError as exc:
+                    errors.append(f"json_sanitized:{exc}")
 
+        # YAML is a superset of JSON and also rescues near-JSON output such
+        # as flow mappings with unquoted keys, so it stays unconditional.
         if yaml is not None:
             try:
                 yaml_result = yaml.safe_load(content)
@@ -335,25 +550,13 @@ Return ONLY the JSON object, no additional text."""
     @staticmethod
     def _escape_unescaped_newlines(content: str) -> str:
         """Escape literal newlines appearing inside quoted strings to aid JSON parsing."""
-        result: list[str] = []
-        in_string = False
-        escape = False
-
-        for char in content:
-            if char == '"' and not escape:
-                in_string = not in_string
-            if char == "\\" and not escape:
-                escape = True
-            else:
-                escape = False
-
-            if char in {"\n", "\r"} and in_string:
-                result.append("\\n")
-                continue
+        if "\n" not in content and "\r" not in content:
+            return content
 
-            result.append(char)
+        def _escape(match: re.Match[str]) -> str:
+            return '"' + match.group(1).replace("\n", "\\n").replace("\r", "\\n") + '"'
 
-        return "".join(result)
+        return _QUOTED_STRING_RE.sub(_escape, content)
 
     @staticmethod
     def _parse_key_value_pairs(content: str) -> dict[str, Any] | None:
@@ -371,7 +574,7 @@ Return ONLY the JSON object, no additional text."""
             if not stripped:
                 continue
 
-            match = re.match(r'^"?([\w\s_]+)"?\s*:\s*(.*)$', stripped)
+            match = _KV_RE.match(stripped)
             if match:
                 key = match.group(1).strip().lower().replace(" ", "_")
                 value = match.group(2).strip().strip('"').strip("'")
@@ -469,30 +672,38 @@ Return ONLY the JSON object, no additional text."""
             num_judges=num_judges,
         ) as span:
             logger.info(
-                f"Multi-judge debate initiated for {metric_type.value}",
+                "Multi-judge debate initiated for %s",
+                metric_type.value,
                 extra={"metric": metric_type.value, "initial_score": initial_evaluation.score},
             )
 
-            # Collect evaluations from additional judges
-            evaluations = [initial_evaluation]
-
-            for judge_num in range(num_judges):
-                # Add previous evaluations to context for debate
-                debate_context = context.copy() if context else {}
-                debate_context["previous_evaluations"] = [
-                    {"judge": i + 1, "score": e.score, "reasoning": e.reasoning}
-                    for i, e in enumerate(evaluations)
-                ]
+            # Collect evaluations from additional judges. Each judge debates
+            # the initial evaluation independently, so they can all run
+            # concurrently instead of waiting on one another's verdicts.
+            debate_context = context.copy() if context else {}
+            debate_context["previous_evaluations"] = [
+                {
+                    "judge": 1,
+                    "score": initial_evaluation.score,
+                    "reasoning": initial_evaluation.reasoning,
+                }
+            ]
 
-                # Get evaluation from additional judge
-                judge_evaluation = await self.evaluate_metric(
-                    metric_type=metric_type,
-                    user_message=user_message,
-                    system_response=system_response,
-                    context=debate_context,
+            additional_evaluations = await asyncio.gather(
+                *(
+                    self.evaluate_metric(
+                        metric_type=metric_type,
+                        user_message=user_message,
+                        system_response=system_response,
+                        context=debate_context,
+                        # Consensus only consumes score/confidence/reasoning,
+                        # so debate rounds get a tighter budget.
+                        max_tokens=180,
+                    )
+                    for _ in range(num_judges)
                 )
-
-                evaluations.append(judge_evaluation)
+            )
+            evaluations = [initial_evaluation, *additional_evaluations]
 
             # Calculate consensus score (weighted average)
             total_weight = sum(e.confidence for e in evaluations)
@@ -503,7 +714,7 @@ Return ONLY the JSON object, no additional text."""
             )
 
             # Determine passed status based on consensus
-            metric = metric_registry.get_metric(metric_type)
+            metric = self._metrics[metric_type]
             consensus_passed = consensus_score >= metric.threshold
 
             # Calculate overall confidence (average)
@@ -512,8 +723,10 @@ Return ONLY the JSON object, no additional text."""
             # Build consensus reasoning
             consensus_reasoning = self._build_consensus_reasoning(evaluations)
 
+            score_variance = self._calculate_variance(evaluations)
+
             span.set_attribute("consensus_score", consensus_score)
-            span.set_attribute("score_variance", self._calculate_variance(evaluations))
+            span.set_attribute("score_variance", score_variance)
 
             logger.info(
                 "Multi-judge debate completed",
@@ -536,7 +749,7 @@ Return ONLY the JSON object, no additional text."""
                     "debate_performed": True,
                     "num_judges": len(evaluations),
                     "individual_scores": [e.score for e in evaluations],
-                    "score_variance": self._calculate_variance(evaluations),
+                    "score_variance": score_variance,
                 },
             )
 
@@ -545,10 +758,15 @@ Return ONLY the JSON object, no additional text."""
         if len(evaluations) < 2:
             return 0.0
 
-        scores = [e.score for e in evaluations]
-        mean = sum(scores) / len(scores)
-        variance = sum((s - mean) ** 2 for s in scores) / len(scores)
-        return variance
+        total = 0.0
+        total_sq = 0.0
+        for evaluation in evaluations:
+            total += evaluation.score
+            total_sq += evaluation.score * evaluation.score
+
+        n = len(evaluations)
+        mean = total / n
+        return total_sq / n - mean * mean
 
     def _build_consensus_reasoning(self, evaluations: list[MetricResult]) -> str:
         """Build consensus reasoning from multiple evaluations"""
@@ -589,72 +807,105 @@ Return ONLY the JSON object, no additional text."""
             metrics_to_use = metrics or self.metrics_to_evaluate
 
             logger.info(
-                f"Evaluating response across {len(metrics_to_use)} metrics",
+                "Evaluating response across %d metrics",
+                len(metrics_to_use),
                 extra={"agent_id": self.agent_id, "num_metrics": len(metrics_to_use)},
             )
 
-            metric_results: dict[str, MetricResult] = {}
+            # Keyed by MetricType throughout; .value is only projected when
+            # serializing the summary, avoiding enum round-trips in between.
+            metric_results: dict[MetricType, MetricResult] = {}
 
-            for metric_type in metrics_to_use:
-                # Initial evaluation
-                result = await self.evaluate_metric(
-                    metric_type=metric_type,
+            # Large metric sets go through one batched invocation; small sets
+            # (and any batch that comes back degraded) use per-metric calls.
+            initial_results: list[MetricResult] | None = None
+            if len(metrics_to_use) > _BATCH_THRESHOLD:
+                batched = await self.evaluate_all_metrics_batched(
+                    metrics=metrics_to_use,
                     user_message=user_message,
                     system_response=system_response,
                     context=context,
                 )
+                if batched is not None:
+                    initial_results = [batched[metric_type] for metric_type in metrics_to_use]
+
+            if initial_results is None:
+                # Metrics are independent: dispatch all initial evaluations
+                # concurrently (the shared semaphore caps in-flight Bedrock
+                # calls)
+                initial_results = await asyncio.gather(
+                    *(
+                        self.evaluate_metric(
+                            metric_type=metric_type,
+                            user_message=user_message,
+                            system_response=system_response,
+                            context=context,
+                        )
+                        for metric_type in metrics_to_use
+                    )
+                )
 
-                # Check if multi-judge debate is needed
+            # Debate only the low-confidence results, also concurrently
+            debate_metrics: list[MetricType] = []
+            debate_tasks = []
+            for metric_type, result in zip(metrics_to_use, initial_results, strict=True):
                 if self.enable_multi_judge and result.confidence < 0.7:
                     logger.debug(
-                        f"Low confidence detected ({result.confidence:.2f}), triggering debate"
+                        "Low confidence detected (%.2f), triggering debate", result.confidence
                     )
                     self.debates_triggered += 1
-
-                    result = await self.multi_judge_debate(
-                        metric_type=metric_type,
-                        user_message=user_message,
-                        system_response=system_response,
-                        initial_evaluation=result,
-                        context=context,
+                    debate_metrics.append(metric_type)
+                    debate_tasks.append(
+                        self.multi_judge_debate(
+                            metric_type=metric_type,
+                            user_message=user_message,
+                            system_response=system_response,
+                            initial_evaluation=result,
+                            context=context,
+                        )
                     )
+                else:
+                    metric_results[metric_type] = result
 
-                metric_results[metric_type.value] = result
+            if debate_tasks:
+                for metric_type, result in zip(
+                    debate_metrics, await asyncio.gather(*debate_tasks), strict=True
+                ):
+                    metric_results[metric_type] = result
 
             self.evaluations_performed += 1
 
-            # Calculate aggregate scores by category
-            quality_scores = [
-                r.score
-                for m, r in metric_results.items()
-                if metric_registry.get_metric(MetricType(m)).category == MetricCategory.QUALITY
-            ]
-            safety_scores = [
-                r.score
-                for m, r in metric_results.items()
-                if metric_registry.get_metric(MetricType(m)).category == MetricCategory.SAFETY
-            ]
-            agent_scores = [
-                r.score
-                for m, r in metric_results.items()
-                if metric_registry.get_metric(MetricType(m)).category
-                == MetricCategory.AGENT_SPECIFIC
-            ]
-
-            # Overall pass/fail determination
-            all_passed = all(r.passed for r in metric_results.values())
-            critical_failures = [
-                m
-                for m, r in metric_results.items()
-                if not r.passed and metric_registry.get_metric(MetricType(m)).threshold >= 0.9
-            ]
+            # Calculate aggregate scores by category and pass/fail status in a
+            # single pass over the results
+            category_scores: dict[MetricCategory, list[float]] = {
+                MetricCategory.QUALITY: [],
+                MetricCategory.SAFETY: [],
+                MetricCategory.AGENT_SPECIFIC: [],
+            }
+            total_score = 0.0
+            failed_metrics: list[str] = []
+            critical_failures: list[str] = []
+
+            for metric_type, result in metric_results.items():
+                _, category, threshold = self._metric_meta[metric_type.value]
+                category_scores[category].append(result.score)
+                total_score += result.score
+                if not result.passed:
+                    failed_metrics.append(metric_type.value)
+                    if threshold >= 0.9:
+                        critical_failures.append(metric_type.value)
+
+            quality_scores = category_scores[MetricCategory.QUALITY]
+            safety_scores = category_scores[MetricCategory.SAFETY]
+            agent_scores = category_scores[MetricCategory.AGENT_SPECIFIC]
+            all_passed = not failed_metrics
 
             evaluation_summary = {
                 "judge_id": self.agent_id,
                 "user_message": user_message,
                 "system_response": system_response,
                 "metric_results": {
-                    metric: {
+                    metric.value: {
                         "score": result.score,
                         "passed": result.passed,
                         "confidence": result.confidence,
@@ -670,12 +921,12 @@ Return ONLY the JSON object, no additional text."""
                     "agent_specific": (
                         sum(agent_scores) / len(agent_scores) if agent_scores else 0.0
                     ),
-                    "overall": sum(r.score for r in metric_results.values()) / len(metric_results),
+                    "overall": total_score / len(metric_results),
                 },
                 "pass_fail": {
                     "all_passed": all_passed,
                     "critical_failures": critical_failures,
-                    "failed_metrics": [m for m, r in metric_results.items() if not r.passed],
+                    "failed_metrics": failed_metrics,
                 },
                 "debates_triggered": self.debates_triggered,
             }
@@ -694,6 +945,51 @@ Return ONLY the JSON object, no additional text."""
 
             return evaluation_summary
 
+    async def evaluate_responses_batch(
+        self,
+        items: list[tuple[str, str, dict[str, Any] | None]],
+        metrics: list[MetricType] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate many conversation turns in one concurrent batch
+
+        Intended for offline runs (regression suites, CI) where many
+        `(user_message, system_response, context)` tuples are scored at once.
+        All items are dispatched concurrently; the shared Bedrock semaphore
+        caps in-flight invocations so throughput scales without overwhelming
+        provider-side limits.
+
+        Args:
+            items: Tuples of (user_message, system_response, context)
+            metrics: Specific metrics to evaluate (None = use agent's default)
+
+        Returns:
+            Evaluation summaries in the same order as the input items
+        """
+        with trace_operation(
+            "batch_response_evaluation", agent_id=self.agent_id, num_items=len(items)
+        ) as span:
+            logger.info(
+                "Evaluating batch of %d responses",
+                len(items),
+                extra={"agent_id": self.agent_id, "num_items": len(items)},
+            )
+
+            results = await asyncio.gather(
+                *(
+                    self.evaluate_response(
+                        user_message=user_message,
+                        system_response=system_response,
+                        context=context,
+                        metrics=metrics,
+                    )
+                    for user_message, system_response, context in items
+                )
+            )
+
+            span.set_attribute("num_items", len(items))
+            return list(results)
+
     async def execute(
         self,
         user_message: str,
@@ -719,7 +1015,7 @@ Return ONLY the JSON object, no additional text."""
 
     def get_agent_info(self) -> dict[str, Any]:
         """Get comprehensive agent information"""
-        base_info = super().get_agent_info()
+        base_info = dict(super().get_agent_info())
         base_info.update(
             {
                 "metrics_evaluated": [m.value for m in self.metrics_to_evaluate],
@@ -878,7 +878,7 @@ class PersonaAgent(BaseAgent):
 
     def get_agent_info(self) -> dict[str, Any]:
         """Get comprehensive agent information"""
-        base_info = super().get_agent_info()
+        base_info = dict(super().get_agent_info())
         base_info.update(
             {
                 "persona_id": self._persona_id,
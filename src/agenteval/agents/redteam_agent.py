@@ -800,7 +800,7 @@ Return ONLY the mutated attack text, nothing else."""
 
     def get_agent_info(self) -> dict[str, Any]:
         """Get comprehensive agent information"""
-        base_info = super().get_agent_info()
+        base_info = dict(super().get_agent_info())
         base_info.update(
             {
                 "attack_categories": [c.value for c in self.attack_categories],
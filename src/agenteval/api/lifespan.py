@@ -4,6 +4,8 @@ FastAPI Lifespan Management
 Handles application startup and shutdown, including DI container lifecycle.
 """
 
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -11,6 +13,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from agenteval.container import get_container
+from agenteval.hot_reload import watch_libraries
 from agenteval.observability.tracer import cleanup_tracing, setup_tracing
 
 logger = logging.getLogger(__name__)
@@ -68,6 +71,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Store container in app state for access in routes
         app.state.container = container
 
+        # Start event-driven library hot-reload (manual /admin/*/reload
+        # endpoints remain available as overrides)
+        logger.info("Starting library hot-reload watcher...")
+        app.state.library_watcher = asyncio.create_task(watch_libraries())
+        logger.info("✓ Library hot-reload watcher started")
+
         logger.info("=" * 60)
         logger.info("✓ AgentEval API startup complete")
         logger.info("=" * 60)
@@ -89,6 +98,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("=" * 60)
 
     try:
+        # Stop the library watcher
+        watcher = getattr(app.state, "library_watcher", None)
+        if watcher is not None:
+            logger.info("Stopping library hot-reload watcher...")
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+            logger.info("✓ Library hot-reload watcher stopped")
+
         # Close DI container and all clients
         logger.info("Closing DI container...")
         container = get_container()
@@ -55,6 +55,18 @@ class BedrockClient:
             ).lower(): settings.aws.bedrock_judge_fallback_model,
         }
 
+    @staticmethod
+    def _performance_kwargs() -> dict[str, str]:
+        """Extra invoke_model kwargs enabling latency-optimized inference.
+
+        Returns ``performanceConfigLatency`` when the demo configuration
+        requests it; 'standard' mode omits the flag entirely so models
+        without latency-optimized support are not affected.
+        """
+        if settings.demo.bedrock_performance_mode == "optimized":
+            return {"performanceConfigLatency": "optimized"}
+        return {}
+
     async def __aenter__(self) -> "BedrockClient":
         """Async context manager entry"""
         self._client = await self.session.client("bedrock-runtime").__aenter__()
@@ -128,6 +140,7 @@ class BedrockClient:
             invoke_kwargs: dict[str, Any] = {
                 "modelId": effective_model_id,
                 "body": json.dumps(body),
+                **self._performance_kwargs(),
             }
 
             response = await self._client.invoke_model(**invoke_kwargs)
@@ -239,6 +252,7 @@ class BedrockClient:
             invoke_kwargs: dict[str, Any] = {
                 "modelId": effective_model_id,
                 "body": json.dumps(body),
+                **self._performance_kwargs(),
             }
 
             response = await self._client.invoke_model(**invoke_kwargs)
@@ -314,6 +328,7 @@ class BedrockClient:
             invoke_kwargs: dict[str, Any] = {
                 "modelId": effective_model_id,
                 "body": json.dumps(body),
+                **self._performance_kwargs(),
             }
 
             response = await self._client.invoke_model(**invoke_kwargs)
@@ -4,6 +4,7 @@ Amazon DynamoDB Client for State Management
 Handles campaign state, turns, evaluations, and attack knowledge base.
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime
@@ -252,6 +253,45 @@ class DynamoDBClient:
             logger.error(f"Failed to get campaign: {e}")
             raise
 
+    async def batch_get_campaigns(self, campaign_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve multiple campaigns with BatchGetItem instead of N GetItem calls
+
+        Args:
+            campaign_ids: Campaign identifiers
+
+        Returns:
+            Mapping of campaign_id to campaign dict (missing IDs are omitted)
+        """
+        self._ensure_connected()
+
+        campaigns: dict[str, dict[str, Any]] = {}
+        unique_ids = list(dict.fromkeys(campaign_ids))
+
+        try:
+            # BatchGetItem accepts at most 100 keys per request
+            for start in range(0, len(unique_ids), 100):
+                request_items: dict[str, Any] = {
+                    self.campaigns_table: {
+                        "Keys": [
+                            {"PK": f"CAMPAIGN#{campaign_id}", "SK": "METADATA"}
+                            for campaign_id in unique_ids[start : start + 100]
+                        ]
+                    }
+                }
+                while request_items:
+                    response = await self._resource.batch_get_item(RequestItems=request_items)
+                    for item in response.get("Responses", {}).get(self.campaigns_table, []):
+                        normalized = self._normalize_campaign_item(dynamodb_to_python(item))
+                        if normalized and normalized.get("campaign_id"):
+                            campaigns[normalized["campaign_id"]] = normalized
+                    request_items = response.get("UnprocessedKeys") or {}
+
+            return campaigns
+        except ClientError as e:
+            logger.error(f"Failed to batch get campaigns: {e}")
+            raise
+
     async def update_campaign_status(
         self, campaign_id: str, status: str, **extra: Any
     ) -> dict[str, Any]:
@@ -327,20 +367,38 @@ class DynamoDBClient:
         if status_filter:
             scan_kwargs["FilterExpression"] = Attr("status").eq(status_filter)
 
-        items: list[dict[str, Any]] = []
-        last_evaluated_key: dict[str, Any] | None = None
-
-        try:
+        # Parallel-segment scan: each segment pages through its share of the
+        # table concurrently, dividing the 1 MB-per-page latency wall by the
+        # segment count. Segments collect into their own lists which are
+        # concatenated in segment order, so the offset/limit window stays
+        # stable across calls regardless of task completion order.
+        total_segments = 4
+        target = offset + limit
+
+        async def _scan_segment(segment: int) -> list[dict[str, Any]]:
+            segment_kwargs = dict(
+                scan_kwargs, Segment=segment, TotalSegments=total_segments
+            )
+            segment_items: list[dict[str, Any]] = []
+            last_evaluated_key: dict[str, Any] | None = None
             while True:
                 if last_evaluated_key:
-                    scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+                    segment_kwargs["ExclusiveStartKey"] = last_evaluated_key
 
-                response = await table.scan(**scan_kwargs)
-                items.extend(response.get("Items", []))
+                response = await table.scan(**segment_kwargs)
+                segment_items.extend(response.get("Items", []))
                 last_evaluated_key = response.get("LastEvaluatedKey")
 
-                if not last_evaluated_key or len(items) >= offset + limit:
-                    break
+                # Worst case the whole window lives in this segment, so each
+                # segment pages until it alone could satisfy it.
+                if not last_evaluated_key or len(segment_items) >= target:
+                    return segment_items
+
+        try:
+            segment_results = await asyncio.gather(
+                *(_scan_segment(i) for i in range(total_segments))
+            )
+            items = [item for segment_items in segment_results for item in segment_items]
 
             sliced = list(islice(items, offset, offset + limit))
             return [self._normalize_campaign_item(dynamodb_to_python(item)) for item in sliced]
@@ -409,8 +467,19 @@ class DynamoDBClient:
             query_kwargs["Limit"] = limit
 
         try:
-            response = await table.query(**query_kwargs)
-            items = response.get("Items", [])
+            # Follow LastEvaluatedKey so campaigns whose turns exceed one
+            # 1 MB response page come back complete in a single logical call.
+            items: list[dict[str, Any]] = []
+            while True:
+                response = await table.query(**query_kwargs)
+                items.extend(response.get("Items", []))
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if not last_evaluated_key or (limit and len(items) >= limit):
+                    break
+                query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+            if limit:
+                items = items[:limit]
             return [dynamodb_to_python(item) for item in items]
         except ClientError as e:
             logger.error(f"Failed to get turns: {e}")
@@ -541,12 +610,21 @@ class DynamoDBClient:
         self._ensure_connected()
         table = await self._resource.Table(self.evaluations_table)
 
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+            "ExpressionAttributeValues": {":pk": f"CAMPAIGN#{campaign_id}", ":sk_prefix": "EVAL#"},
+        }
+
         try:
-            response = await table.query(
-                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                ExpressionAttributeValues={":pk": f"CAMPAIGN#{campaign_id}", ":sk_prefix": "EVAL#"},
-            )
-            items = response.get("Items", [])
+            items: list[dict[str, Any]] = []
+            while True:
+                response = await table.query(**query_kwargs)
+                items.extend(response.get("Items", []))
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if not last_evaluated_key:
+                    break
+                query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
             return [dynamodb_to_python(item) for item in items]
         except ClientError as e:
             logger.error(f"Failed to get evaluations: {e}")
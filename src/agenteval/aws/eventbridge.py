@@ -2,18 +2,25 @@
 Amazon EventBridge Client for Event-Driven Architecture
 """
 
-import json
+import asyncio
+import contextlib
 import logging
 from datetime import datetime
 from typing import Any
 
 import aioboto3
+import orjson
 from botocore.exceptions import ClientError
 
 from agenteval.config import settings
 
 logger = logging.getLogger(__name__)
 
+# PutEvents accepts at most 10 entries per call; buffered events are flushed
+# when a full batch accumulates or after this many seconds, whichever first.
+_MAX_BATCH_SIZE = 10
+_FLUSH_INTERVAL_SECONDS = 0.2
+
 
 class EventBridgeClient:
     """
@@ -56,6 +63,9 @@ class EventBridgeClient:
         )
         self._client: Any | None = None
         self._connected: bool = False
+        self._event_buffer: list[dict[str, Any]] = []
+        self._buffer_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
 
         logger.debug(
             "EventBridgeClient initialized",
@@ -70,8 +80,16 @@ class EventBridgeClient:
             logger.info("EventBridge client connected")
 
     async def close(self) -> None:
-        """Close EventBridge client connection"""
+        """Close EventBridge client connection, flushing any buffered events"""
         if self._connected and self._client:
+            if self._flush_task and not self._flush_task.done():
+                # Await the cancellation: a delayed flush interrupted inside
+                # put_events has already popped its entries from the buffer,
+                # so it must settle before the final flush below.
+                self._flush_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._flush_task
+            await self.flush_events()
             await self._client.__aexit__(None, None, None)
             self._connected = False
             logger.info("EventBridge client closed")
@@ -105,15 +123,7 @@ class EventBridgeClient:
         self._ensure_connected()
         try:
             response = await self._client.put_events(
-                Entries=[
-                    {
-                        "Time": datetime.utcnow(),
-                        "Source": source,
-                        "DetailType": detail_type,
-                        "Detail": json.dumps(detail),
-                        "EventBusName": self.bus_name,
-                    }
-                ]
+                Entries=[self._build_entry(detail_type, detail, source)]
             )
 
             if response["FailedEntryCount"] > 0:
@@ -128,6 +138,67 @@ class EventBridgeClient:
             logger.error(f"EventBridge error: {e}")
             raise
 
+    def _build_entry(
+        self, detail_type: str, detail: dict[str, Any], source: str = "agenteval"
+    ) -> dict[str, Any]:
+        """Build a PutEvents entry for the configured bus"""
+        return {
+            "Time": datetime.utcnow(),
+            "Source": source,
+            "DetailType": detail_type,
+            "Detail": orjson.dumps(detail, default=str).decode(),
+            "EventBusName": self.bus_name,
+        }
+
+    async def publish_event_buffered(
+        self, detail_type: str, detail: dict[str, Any], source: str = "agenteval"
+    ) -> None:
+        """
+        Queue an event for batched delivery
+
+        Entries are sent with a single PutEvents call once a full batch of
+        10 accumulates, or at the latest 200 ms after the first buffered
+        entry. Use for high-frequency events (e.g. per-turn) where the
+        per-call round trip dominates; `close()` flushes whatever remains.
+        """
+        self._ensure_connected()
+        async with self._buffer_lock:
+            self._event_buffer.append(self._build_entry(detail_type, detail, source))
+            should_flush = len(self._event_buffer) >= _MAX_BATCH_SIZE
+        if should_flush:
+            await self.flush_events()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(_FLUSH_INTERVAL_SECONDS)
+        await self.flush_events()
+
+    async def flush_events(self) -> None:
+        """Send all buffered events in one PutEvents call"""
+        async with self._buffer_lock:
+            entries, self._event_buffer = self._event_buffer, []
+        if not entries:
+            return
+
+        try:
+            response = await self._client.put_events(Entries=entries)
+        except asyncio.CancelledError:
+            # Cancelled mid-call: put the entries back so a later flush
+            # (e.g. the final one in close()) can retry them.
+            async with self._buffer_lock:
+                self._event_buffer[:0] = entries
+            raise
+        except ClientError as e:
+            logger.error(f"EventBridge error during flush: {e}")
+            raise
+
+        failed = response.get("FailedEntryCount", 0)
+        if failed:
+            logger.error(f"Failed to publish {failed}/{len(entries)} buffered events")
+        else:
+            logger.info(f"Published {len(entries)} buffered events")
+
     async def publish_campaign_event(self, event_type: str, campaign_id: str, **extra: Any) -> str:
         """
         Publish campaign-related event
@@ -145,9 +216,13 @@ class EventBridgeClient:
 
     async def publish_turn_event(
         self, campaign_id: str, turn_id: str, agent_type: str, trace_id: str, **extra: Any
-    ) -> str:
+    ) -> None:
         """
-        Publish conversation turn event
+        Queue a conversation turn event for batched delivery
+
+        Turn events fire once per conversation turn — the highest-frequency
+        event in the system — so they go through the buffered path instead
+        of paying one PutEvents round trip each.
 
         Args:
             campaign_id: Campaign identifier
@@ -155,9 +230,6 @@ class EventBridgeClient:
             agent_type: Type of agent (persona, redteam)
             trace_id: Distributed trace ID
             **extra: Additional event data
-
-        Returns:
-            Event ID
         """
         detail = {
             "campaign_id": campaign_id,
@@ -167,7 +239,7 @@ class EventBridgeClient:
             "timestamp": datetime.utcnow().isoformat(),
             **extra,
         }
-        return await self.publish_event("TurnCompleted", detail)
+        await self.publish_event_buffered("TurnCompleted", detail)
 
     async def publish_attack_event(
         self,
@@ -5,7 +5,6 @@ Supports multiple report formats: JSON, CSV, PDF, HTML
 """
 
 import csv
-import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -15,12 +14,22 @@ from pathlib import Path
 from typing import Any
 
 import aioboto3
+import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from agenteval.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Managed-transfer configuration for object downloads: objects above the
+# threshold are fetched as concurrent ranged GETs instead of one TCP stream.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+)
+
 
 class ReportFormat(str, Enum):
     """Supported report formats"""
@@ -63,8 +72,8 @@ class JSONReportRenderer(ReportRenderer):
 
     async def render(self, report_data: dict[str, Any]) -> bytes:
         """Render as formatted JSON"""
-        json_str = json.dumps(report_data, indent=2, default=str)
-        return json_str.encode("utf-8")
+        # orjson serializes in C and returns bytes directly
+        return orjson.dumps(report_data, option=orjson.OPT_INDENT_2, default=str)
 
     def get_content_type(self) -> str:
         return "application/json"
@@ -524,7 +533,7 @@ class S3Client:
         """Upload JSON data to S3"""
         self._ensure_connected()
         try:
-            json_bytes = json.dumps(data, indent=2).encode("utf-8")
+            json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
             await self._client.put_object(
                 Bucket=bucket, Key=key, Body=json_bytes, ContentType="application/json"
             )
@@ -541,7 +550,7 @@ class S3Client:
             response = await self._client.get_object(Bucket=bucket, Key=key)
             body = await response["Body"].read()
             response["Body"].close()
-            return json.loads(body.decode("utf-8"))
+            return orjson.loads(body)
         except ClientError as e:
             logger.error(f"Failed to download JSON: {e}")
             raise
@@ -598,12 +607,11 @@ class S3Client:
         """
         self._ensure_connected()
         try:
-            response = await self._client.get_object(Bucket=bucket, Key=key)
-            body = await response["Body"].read()
-            response["Body"].close()
-
             destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_bytes(body)
+            # Managed transfer streams to disk and splits large objects into
+            # concurrent ranged GETs (see _TRANSFER_CONFIG) instead of
+            # buffering the whole body in memory.
+            await self._client.download_file(bucket, key, str(destination), Config=_TRANSFER_CONFIG)
 
             logger.info(f"Downloaded s3://{bucket}/{key} -> {destination}")
             return destination
@@ -51,6 +51,16 @@ class AWSConfig(BaseSettings):
     bedrock_judge_profile_arn: str | None = Field(
         default=None, description="Inference profile ARN for judge model (if required)"
     )
+    bedrock_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent Bedrock invocations per judge agent",
+    )
+    bedrock_judge_max_tokens: int = Field(
+        default=220,
+        ge=1,
+        description="Token budget for a single metric evaluation response (a well-formed evaluation JSON is ~150 tokens)",
+    )
 
     # DynamoDB Tables
     dynamodb_campaigns_table: str = Field(
@@ -212,6 +222,13 @@ class DemoConfig(BaseSettings):
     redteam_max_turns: int = Field(
         default=2, description="Default maximum turns for red team campaigns during live demo", ge=1
     )
+    bedrock_performance_mode: str = Field(
+        default="optimized",
+        description=(
+            "Bedrock performanceConfig latency mode ('optimized' or 'standard'); "
+            "latency-optimized inference roughly halves per-call latency on supported models"
+        ),
+    )
 
     model_config = SettingsConfigDict(env_prefix="DEMO_", case_sensitive=False, extra="ignore")
 
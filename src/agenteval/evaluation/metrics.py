@@ -963,13 +963,13 @@ class MetricLibrary(BaseLibrary[MetricDefinition]):
         # Maintain backward compatibility
         self.metrics = self.items
 
-    def reload(self) -> None:
+    def reload(self, *, force: bool = False) -> None:
         """
         Reload metrics from file (for hot-reloading)
 
         Overrides BaseLibrary.reload() to maintain backward compatibility.
         """
-        super().reload()
+        super().reload(force=force)
         self.metrics = self.items
 
     # ========================================================================
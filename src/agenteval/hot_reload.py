@@ -0,0 +1,70 @@
+"""
+Hot Reload - event-driven library reloads
+
+Watches the persona/attack/metric YAML libraries with kernel-level change
+notifications (inotify/FSEvents via watchfiles) and reloads only the library
+whose file actually changed. Replaces timer- or curl-driven polling; the
+/admin/*/reload HTTP routes remain available as manual overrides.
+
+watchfiles ships with ``uvicorn[standard]``; if it is unavailable the watcher
+degrades to a no-op and manual reloads keep working.
+"""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+try:
+    from watchfiles import awatch
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    WATCHFILES_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _library_reloaders() -> dict[Path, Callable[[], None]]:
+    """Map each library YAML path to its reload entry point.
+
+    Imported lazily so importing this module never forces the libraries
+    (and their YAML parsing) to load.
+    """
+    from agenteval.evaluation import get_metric_library, reload_metric_library
+    from agenteval.persona import get_persona_library, reload_persona_library
+    from agenteval.redteam import get_attack_library, reload_attack_library
+
+    return {
+        Path(get_persona_library().library_path).resolve(): reload_persona_library,
+        Path(get_attack_library().library_path).resolve(): reload_attack_library,
+        Path(get_metric_library().library_path).resolve(): reload_metric_library,
+    }
+
+
+async def watch_libraries() -> None:
+    """Watch library files and reload the affected library on each change.
+
+    Runs until cancelled; intended to be started as a background task during
+    application startup.
+    """
+    if not WATCHFILES_AVAILABLE:
+        logger.warning("watchfiles not installed; library hot-reload watcher disabled")
+        return
+
+    reloaders = _library_reloaders()
+    watched = [path for path in reloaders if path.exists()]
+    if not watched:
+        logger.warning("No library files found to watch; hot-reload watcher disabled")
+        return
+
+    logger.info("Watching %d library file(s) for changes", len(watched))
+    async for changes in awatch(*watched):
+        for _change_type, changed_path in changes:
+            reload_fn = reloaders.get(Path(changed_path).resolve())
+            if reload_fn is None:
+                continue
+            logger.info("Library file changed, reloading: %s", changed_path)
+            try:
+                reload_fn()
+            except Exception as e:
+                logger.error("Failed to reload library for %s: %s", changed_path, e)
@@ -5,7 +5,9 @@ Provides foundation for all agent libraries (Personas, Attacks, Metrics).
 Ensures consistency, modularity, and extensibility.
 """
 
+import hashlib
 import logging
+import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -14,8 +16,18 @@ from typing import Any, Generic, TypeVar
 
 import yaml
 
+try:
+    # libyaml-backed loader: ~5-20x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Parsed-library sidecar caches live here, keyed by content hash: reloading an
+# unchanged library is a pickle.load (C-speed) instead of a YAML parse.
+_CACHE_DIR = Path.home() / ".cache" / "agenteval"
+
 
 class LibraryType(str, Enum):
     """Types of libraries in AgentEval"""
@@ -100,6 +112,7 @@ class BaseLibrary(ABC, Generic[T]):
         self.library_type = library_type
         self.load_strategy = load_strategy
         self.items: dict[str, T] = {}
+        self._last_mtime_ns: int | None = None
 
         # Determine library path
         self.library_path = library_path or self._get_default_library_path()
@@ -178,8 +191,8 @@ class BaseLibrary(ABC, Generic[T]):
                 self._load_default_items()
                 return
 
-            with open(library_path) as f:
-                data = yaml.safe_load(f)
+            self._last_mtime_ns = library_path.stat().st_mtime_ns
+            data = self._load_library_data(library_path)
 
             # Validate structure
             items_key = f"{self.library_type.value}s"  # personas, attacks, metrics
@@ -218,6 +231,35 @@ class BaseLibrary(ABC, Generic[T]):
             logger.error(f"Failed to load library: {e}", exc_info=True)
             self._load_default_items()
 
+    def _load_library_data(self, library_path: Path) -> Any:
+        """Parse the library file, going through a pickle sidecar cache.
+
+        The cache key is the content hash, so an unchanged file skips YAML
+        parsing entirely and a changed file transparently rebuilds its cache
+        entry. Cache failures fall back to a plain YAML parse.
+        """
+        raw = library_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()[:16]
+        cache_path = _CACHE_DIR / f"{self.library_type.value}s-{digest}.pkl"
+
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)  # noqa: S301 - cache written only by this process
+            except Exception as e:
+                logger.warning(f"Discarding unreadable library cache {cache_path}: {e}")
+
+        data = yaml.load(raw, Loader=_YamlLoader)
+
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write library cache {cache_path}: {e}")
+
+        return data
+
     def _load_from_database(self) -> None:
         """
         Load items from database
@@ -229,8 +271,22 @@ class BaseLibrary(ABC, Generic[T]):
         )
         self._load_default_items()
 
-    def reload(self) -> None:
-        """Reload items from source (for hot-reloading)"""
+    def reload(self, *, force: bool = False) -> None:
+        """Reload items from source (for hot-reloading).
+
+        Skips the reload when the library file's mtime is unchanged since the
+        last load, so indiscriminate reload-everything calls only re-parse the
+        libraries that actually changed. Pass ``force=True`` to bypass.
+        """
+        if not force and self._last_mtime_ns is not None:
+            try:
+                current_mtime_ns = Path(self.library_path).stat().st_mtime_ns
+            except OSError:
+                current_mtime_ns = None
+            if current_mtime_ns == self._last_mtime_ns:
+                logger.debug(f"{self.library_type.value.title()} library unchanged; skipping reload")
+                return
+
         logger.info(f"Reloading {self.library_type.value} library")
         self.items.clear()
         self.load()
@@ -20,6 +20,7 @@ from opentelemetry.propagators.composite import CompositePropagator
 from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
 from opentelemetry.sdk.trace import Span, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from agenteval.config import settings
@@ -55,8 +56,18 @@ class TracerSetup:
                 }
             )
 
-            # Create tracer provider
-            self.provider = TracerProvider(resource=resource)
+            # Create tracer provider with head-based sampling. Unsampled
+            # requests get non-recording spans, so span/attribute allocation
+            # and export costs vanish for them. ParentBased honours the
+            # incoming sampled flag, so flows a caller chose to trace (e.g.
+            # red-team turns forwarding traceparent) are always retained.
+            sample_rate = settings.observability.trace_sample_rate
+            self.provider = TracerProvider(
+                resource=resource,
+                sampler=ParentBased(TraceIdRatioBased(sample_rate)),
+            )
+            if sample_rate < 1.0:
+                logger.info("Head-based trace sampling enabled at %.1f%%", sample_rate * 100)
 
             # Add OTLP exporter for production
             if settings.is_production or settings.app.environment != "test":
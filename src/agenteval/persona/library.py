@@ -218,13 +218,13 @@ class PersonaLibrary(BaseLibrary[PersonaDefinition]):
         # Maintain backward compatibility
         self.personas = self.items
 
-    def reload(self) -> None:
+    def reload(self, *, force: bool = False) -> None:
         """
         Reload personas from file (for hot-reloading)
 
         Overrides BaseLibrary.reload() to maintain backward compatibility.
         """
-        super().reload()
+        super().reload(force=force)
         self.personas = self.items
 
     # ========================================================================
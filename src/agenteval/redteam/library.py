@@ -289,13 +289,13 @@ class AttackLibrary(BaseLibrary[AttackPattern]):
         # Maintain backward compatibility
         self.attacks = self.items
 
-    def reload(self) -> None:
+    def reload(self, *, force: bool = False) -> None:
         """
         Reload attacks from file (for hot-reloading)
 
         Overrides BaseLibrary.reload() to maintain backward compatibility.
         """
-        super().reload()
+        super().reload(force=force)
         self.attacks = self.items
 
     # ========================================================================
@@ -8,10 +8,11 @@ and the orchestrated live-demo workflow (`agenteval.cli.live_demo`).
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import Sequence
 from pathlib import Path
 
+import orjson
+
 from agenteval.utils.live_demo_env import bootstrap_live_demo_env, refresh_settings
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -28,7 +29,9 @@ def _ensure_directory(path: Path) -> Path:
 
 def _write_json(path: Path, payload) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, default=str))
+    # orjson serializes in C and returns bytes directly, skipping the
+    # intermediate str of json.dumps.
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str))
 
 
 async def pull_campaign_data(
@@ -36,13 +39,24 @@ async def pull_campaign_data(
     output_dir: Path,
     campaign_id: str | None,
     limit: int,
-) -> list[Path]:
-    """Download artefacts for matching campaigns into the specified directory."""
+    *,
+    return_count: bool = False,
+) -> list[Path] | int:
+    """Download artefacts for matching campaigns into the specified directory.
+
+    With ``return_count=True`` only the number of downloaded files is
+    returned and the per-file ``Path`` list is never materialized — callers
+    that just report a count (the live demo) skip the list bookkeeping.
+    """
     dynamodb = container.dynamodb()
     s3_client = container.s3()
     await dynamodb.connect()
     await s3_client.connect()
-    downloaded_files: list[Path] = []
+    downloaded_files: list[Path] | None = None if return_count else []
+    file_count = 0
+
+    def _result() -> list[Path] | int:
+        return file_count if return_count else downloaded_files
 
     try:
         if campaign_id:
@@ -53,13 +67,13 @@ async def pull_campaign_data(
     except Exception as e:
         # Handle case where AWS resources don't exist yet
         if "ResourceNotFoundException" in str(e) or "does not exist" in str(e):
-            # Resources not provisioned yet - return empty list gracefully
-            return downloaded_files
+            # Resources not provisioned yet - return empty result gracefully
+            return _result()
         # Re-raise other exceptions
         raise
 
     if not campaigns:
-        return downloaded_files
+        return _result()
 
     for campaign in campaigns:
         if not campaign:
@@ -74,13 +88,15 @@ async def pull_campaign_data(
         results_dir = _ensure_directory(campaign_dir / "s3" / "results")
         reports_dir = _ensure_directory(campaign_dir / "s3" / "reports")
 
-        _write_json(dynamo_dir / "campaign.json", campaign)
+        # Offload file writes to the default executor so the event loop keeps
+        # serving the concurrent S3/DynamoDB work while artefacts hit disk.
+        await asyncio.to_thread(_write_json, dynamo_dir / "campaign.json", campaign)
 
         turns = await dynamodb.get_turns(cid)
-        _write_json(dynamo_dir / "turns.json", turns)
+        await asyncio.to_thread(_write_json, dynamo_dir / "turns.json", turns)
 
         evaluations = await dynamodb.get_evaluations(cid)
-        _write_json(dynamo_dir / "evaluations.json", evaluations)
+        await asyncio.to_thread(_write_json, dynamo_dir / "evaluations.json", evaluations)
 
         # Download results payloads
         result_objects = await s3_client.list_objects(
@@ -99,7 +115,9 @@ async def pull_campaign_data(
                 key=key,
                 destination=destination,
             )
-            downloaded_files.append(downloaded)
+            file_count += 1
+            if downloaded_files is not None:
+                downloaded_files.append(downloaded)
 
         # Download rendered reports
         report_objects = await s3_client.list_objects(
@@ -118,9 +136,11 @@ async def pull_campaign_data(
                 key=key,
                 destination=destination,
             )
-            downloaded_files.append(downloaded)
+            file_count += 1
+            if downloaded_files is not None:
+                downloaded_files.append(downloaded)
 
-    return downloaded_files
+    return _result()
 
 
 async def pull_live_reports_async(
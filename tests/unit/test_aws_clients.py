@@ -5,6 +5,7 @@ Tests the connect()/close() lifecycle and connection validation
 for DynamoDB, S3, XRay, and EventBridge clients.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -184,6 +185,118 @@ class TestEventBridgeClientLifecycle:
             await client.publish_event("TestEvent", {"test": "data"})
 
 
+class TestEventBridgeBuffering:
+    """Test the buffered event publishing path"""
+
+    async def _connected_client(self) -> tuple[EventBridgeClient, AsyncMock]:
+        """Connect an EventBridgeClient against a mocked events client"""
+        client = EventBridgeClient()
+        mock_events = AsyncMock()
+        mock_events.put_events.return_value = {
+            "FailedEntryCount": 0,
+            "Entries": [{"EventId": "event-1"}],
+        }
+
+        with patch.object(client.session, "client") as mock_client:
+            mock_context = AsyncMock()
+            mock_context.__aenter__.return_value = mock_events
+            mock_client.return_value = mock_context
+            await client.connect()
+
+        return client, mock_events
+
+    @pytest.mark.asyncio
+    async def test_buffered_event_is_queued_not_sent(self):
+        """Test that a single buffered event waits for the flush interval"""
+        client, mock_events = await self._connected_client()
+
+        await client.publish_event_buffered("TurnCompleted", {"turn": 1})
+
+        mock_events.put_events.assert_not_called()
+        assert len(client._event_buffer) == 1
+        assert client._flush_task is not None
+
+        client._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """Test that a full batch of 10 triggers one PutEvents call"""
+        client, mock_events = await self._connected_client()
+
+        for i in range(10):
+            await client.publish_event_buffered("TurnCompleted", {"turn": i})
+
+        mock_events.put_events.assert_called_once()
+        entries = mock_events.put_events.call_args.kwargs["Entries"]
+        assert len(entries) == 10
+        assert client._event_buffer == []
+
+    @pytest.mark.asyncio
+    async def test_delayed_flush_fires_after_interval(self):
+        """Test that buffered events are flushed after the interval elapses"""
+        client, mock_events = await self._connected_client()
+
+        await client.publish_event_buffered("TurnCompleted", {"turn": 1})
+        await asyncio.wait_for(client._flush_task, timeout=2.0)
+
+        mock_events.put_events.assert_called_once()
+        assert client._event_buffer == []
+
+    @pytest.mark.asyncio
+    async def test_flush_events_sends_all_buffered_entries(self):
+        """Test that flush_events drains the buffer in one call"""
+        client, mock_events = await self._connected_client()
+
+        await client.publish_event_buffered("TurnCompleted", {"turn": 1})
+        await client.publish_event_buffered("TurnCompleted", {"turn": 2})
+        await client.flush_events()
+
+        mock_events.put_events.assert_called_once()
+        entries = mock_events.put_events.call_args.kwargs["Entries"]
+        assert len(entries) == 2
+        assert client._event_buffer == []
+
+        client._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_events_before_disconnect(self):
+        """Test that close() settles the flush task and sends what remains"""
+        client, mock_events = await self._connected_client()
+
+        await client.publish_event_buffered("TurnCompleted", {"turn": 1})
+        await client.close()
+
+        mock_events.put_events.assert_called_once()
+        entries = mock_events.put_events.call_args.kwargs["Entries"]
+        assert len(entries) == 1
+        assert client._connected is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_requeues_entries(self):
+        """Test that a flush cancelled mid-call puts its entries back"""
+        client, mock_events = await self._connected_client()
+
+        started = asyncio.Event()
+
+        async def _blocked_put_events(**kwargs):
+            started.set()
+            await asyncio.sleep(30)
+
+        mock_events.put_events.side_effect = _blocked_put_events
+
+        await client.publish_event_buffered("TurnCompleted", {"turn": 1})
+        flush = asyncio.create_task(client.flush_events())
+        await started.wait()
+
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        assert len(client._event_buffer) == 1
+
+        client._flush_task.cancel()
+
+
 class TestDynamoDBHelperMethods:
     """Test the newly implemented DynamoDB helper methods"""
 
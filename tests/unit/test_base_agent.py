@@ -9,9 +9,18 @@ from uuid import UUID
 
 import pytest
 
+import agenteval.agents.base as base_module
 from agenteval.agents.base import BaseAgent
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_bedrock():
+    """Keep the process-wide shared Bedrock client from leaking across tests."""
+    yield
+    base_module._shared_bedrock = None
+    base_module._shared_bedrock_refs = 0
+
+
 # Concrete implementation for testing
 class TestableAgent(BaseAgent):
     """Concrete implementation of BaseAgent for testing"""
@@ -94,7 +103,19 @@ class TestBaseAgentLifecycle:
 
     @pytest.mark.asyncio
     async def test_initialize(self):
-        """Test agent initialization"""
+        """Test agent initialization defers Bedrock client creation"""
+        agent = TestableAgent()
+
+        with patch("agenteval.agents.base.BedrockClient") as MockBedrock:
+            await agent.initialize()
+
+            # Bedrock client is created lazily on first LLM call
+            MockBedrock.assert_not_called()
+            assert agent.bedrock is None
+
+    @pytest.mark.asyncio
+    async def test_ensure_bedrock_creates_client_once(self):
+        """Test lazy Bedrock client creation on first use"""
         agent = TestableAgent()
 
         with patch("agenteval.agents.base.BedrockClient") as MockBedrock:
@@ -102,13 +123,35 @@ class TestBaseAgentLifecycle:
             mock_bedrock.__aenter__ = AsyncMock(return_value=mock_bedrock)
             MockBedrock.return_value = mock_bedrock
 
-            await agent.initialize()
+            first = await agent._ensure_bedrock()
+            second = await agent._ensure_bedrock()
 
-            # Verify Bedrock client was created
             MockBedrock.assert_called_once()
             mock_bedrock.__aenter__.assert_called_once()
+            assert first is second
             assert agent.bedrock == mock_bedrock
 
+    @pytest.mark.asyncio
+    async def test_shared_bedrock_across_agents(self):
+        """Test that agents share one Bedrock client and release it last-out"""
+        first_agent = TestableAgent()
+        second_agent = TestableAgent()
+
+        with patch("agenteval.agents.base.BedrockClient") as MockBedrock:
+            mock_bedrock = AsyncMock()
+            mock_bedrock.__aenter__ = AsyncMock(return_value=mock_bedrock)
+            mock_bedrock.__aexit__ = AsyncMock()
+            MockBedrock.return_value = mock_bedrock
+
+            assert await first_agent._ensure_bedrock() is await second_agent._ensure_bedrock()
+            MockBedrock.assert_called_once()
+
+            await first_agent.cleanup()
+            mock_bedrock.__aexit__.assert_not_called()
+
+            await second_agent.cleanup()
+            mock_bedrock.__aexit__.assert_called_once_with(None, None, None)
+
     @pytest.mark.asyncio
     async def test_cleanup(self):
         """Test agent cleanup"""
@@ -147,6 +190,8 @@ class TestBaseAgentLifecycle:
             async with agent as ctx_agent:
                 # Verify agent is returned
                 assert ctx_agent == agent
+                # Client is only created once the agent actually invokes an LLM
+                await agent._ensure_bedrock()
                 assert agent.bedrock == mock_bedrock
 
             # Verify cleanup was called
@@ -221,14 +266,43 @@ class TestBaseAgentLLMInvocation:
         assert call_kwargs["model_id"] == "anthropic.claude-haiku-4-5-20251001-v1:0"
 
     @pytest.mark.asyncio
-    async def test_invoke_llm_no_bedrock_client(self):
-        """Test invoke_llm fails when bedrock not initialized"""
+    async def test_invoke_llm_creates_client_lazily(self):
+        """Test invoke_llm creates the Bedrock client on first call"""
         agent = TestableAgent()
         agent.bedrock = None
 
-        with pytest.raises(RuntimeError, match="Bedrock client not initialized"):
+        with patch("agenteval.agents.base.BedrockClient") as MockBedrock:
+            mock_bedrock = AsyncMock()
+            mock_bedrock.__aenter__ = AsyncMock(return_value=mock_bedrock)
+            mock_bedrock.invoke_model = AsyncMock(return_value={"content": "Response", "usage": {}})
+            MockBedrock.return_value = mock_bedrock
+
             await agent.invoke_llm(prompt="Test")
 
+            MockBedrock.assert_called_once()
+            mock_bedrock.invoke_model.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_specialize_binds_invocation_parameters(self):
+        """Test specialize() pre-binds model/sampling parameters"""
+        agent = TestableAgent()
+
+        mock_bedrock = AsyncMock()
+        mock_bedrock.invoke_model = AsyncMock(return_value={"content": "Response", "usage": {}})
+        agent.bedrock = mock_bedrock
+
+        call = agent.specialize(max_tokens=250, temperature=0.2, system_prompt="Stay terse")
+        await call("First")
+        await call("Second")
+
+        assert mock_bedrock.invoke_model.call_count == 2
+        call_kwargs = mock_bedrock.invoke_model.call_args.kwargs
+        assert call_kwargs["prompt"] == "Second"
+        assert call_kwargs["model_id"] == "anthropic.claude-haiku-4-5-20251001-v1:0"
+        assert call_kwargs["max_tokens"] == 250
+        assert call_kwargs["temperature"] == 0.2
+        assert call_kwargs["system_prompt"] == "Stay terse"
+
     @pytest.mark.asyncio
     async def test_invoke_llm_error_handling(self):
         """Test LLM invocation error handling"""
@@ -261,7 +335,7 @@ class TestBaseAgentUtilities:
         normalized = BaseAgent._normalize_usage(usage)
 
         assert normalized == {"input_tokens": 10, "output_tokens": 20}
-        assert normalized is not usage  # Should be a copy
+        assert normalized is usage  # Dicts pass through without a defensive copy
 
     def test_normalize_usage_none(self):
         """Test _normalize_usage with None input"""
@@ -0,0 +1,92 @@
+"""
+Unit tests for the demo chatbot SessionStore.
+
+Covers the LRU bound and idle-TTL eviction that keep the in-memory store
+from growing for the lifetime of the process.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from examples.demo_chatbot import app as chatbot_app  # noqa: E402
+from examples.demo_chatbot.app import SessionStore  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> dict[str, float]:
+    """Controllable monotonic clock for TTL tests"""
+    state = {"now": 0.0}
+    monkeypatch.setattr(chatbot_app.time, "monotonic", lambda: state["now"])
+    return state
+
+
+class TestSessionStore:
+    """Test suite for the bounded session store"""
+
+    def test_get_or_create_reuses_live_session(self, clock):
+        """Test that an existing session ID returns the same session"""
+        store = SessionStore()
+
+        session = store.get_or_create(None, persona="default")
+        again = store.get_or_create(session.session_id, persona=None)
+
+        assert again is session
+        assert len(store.all_sessions()) == 1
+
+    def test_lru_eviction_drops_oldest_session(self, clock):
+        """Test that exceeding max_sessions evicts the least recently used"""
+        store = SessionStore(max_sessions=2)
+
+        first = store.get_or_create(None, persona="default")
+        second = store.get_or_create(None, persona="default")
+        third = store.get_or_create(None, persona="default")
+
+        sessions = store.all_sessions()
+        assert first.session_id not in sessions
+        assert second.session_id in sessions
+        assert third.session_id in sessions
+
+    def test_touch_protects_recently_used_session(self, clock):
+        """Test that re-using a session moves it off the eviction front"""
+        store = SessionStore(max_sessions=2)
+
+        first = store.get_or_create(None, persona="default")
+        second = store.get_or_create(None, persona="default")
+        store.get_or_create(first.session_id, persona=None)
+        store.get_or_create(None, persona="default")
+
+        sessions = store.all_sessions()
+        assert first.session_id in sessions
+        assert second.session_id not in sessions
+
+    def test_expired_session_is_replaced(self, clock):
+        """Test that a session idle past the TTL starts fresh"""
+        store = SessionStore(ttl_seconds=10.0)
+
+        session = store.get_or_create(None, persona="default")
+        session.record("user", "hello")
+
+        clock["now"] = 11.0
+        revived = store.get_or_create(session.session_id, persona=None)
+
+        assert revived is not session
+        assert revived.session_id == session.session_id
+        assert revived.turns == []
+
+    def test_reset_clears_turns_and_returns_count(self, clock):
+        """Test that reset empties the session and reports cleared turns"""
+        store = SessionStore()
+
+        session = store.get_or_create(None, persona="default")
+        session.record("user", "hello")
+        session.record("assistant", "hi")
+
+        assert store.reset(session.session_id) == 2
+        assert session.turns == []
+        assert store.reset("unknown-session") == 0
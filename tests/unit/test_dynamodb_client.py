@@ -241,3 +241,77 @@ class TestCampaignOperations:
         result = await client.create_campaign("test-campaign-1", campaign_config)
 
         # Verify campaign was created
+        mock_table.put_item.assert_called_once()
+        assert result["campaign_id"] == "test-campaign-1"
+
+
+class TestBatchGetCampaigns:
+    """Test suite for batched campaign retrieval"""
+
+    def _connected_client(self) -> tuple[DynamoDBClient, AsyncMock]:
+        client = DynamoDBClient()
+        client._connected = True
+        mock_resource = MagicMock()
+        mock_resource.batch_get_item = AsyncMock()
+        client._resource = mock_resource
+        return client, mock_resource.batch_get_item
+
+    @staticmethod
+    def _item(campaign_id: str) -> dict:
+        return {"campaign_id": campaign_id, "status": "completed", "config": {}}
+
+    @pytest.mark.asyncio
+    async def test_batch_get_returns_mapping(self):
+        """Test that one BatchGetItem call serves multiple campaign IDs"""
+        client, mock_batch_get = self._connected_client()
+        mock_batch_get.return_value = {
+            "Responses": {client.campaigns_table: [self._item("c1"), self._item("c2")]}
+        }
+
+        result = await client.batch_get_campaigns(["c1", "c2"])
+
+        mock_batch_get.assert_called_once()
+        keys = mock_batch_get.call_args.kwargs["RequestItems"][client.campaigns_table]["Keys"]
+        assert keys == [
+            {"PK": "CAMPAIGN#c1", "SK": "METADATA"},
+            {"PK": "CAMPAIGN#c2", "SK": "METADATA"},
+        ]
+        assert set(result) == {"c1", "c2"}
+        assert result["c1"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_batch_get_retries_unprocessed_keys(self):
+        """Test that UnprocessedKeys are re-requested until drained"""
+        client, mock_batch_get = self._connected_client()
+        unprocessed = {
+            client.campaigns_table: {"Keys": [{"PK": "CAMPAIGN#c2", "SK": "METADATA"}]}
+        }
+        mock_batch_get.side_effect = [
+            {
+                "Responses": {client.campaigns_table: [self._item("c1")]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {client.campaigns_table: [self._item("c2")]}},
+        ]
+
+        result = await client.batch_get_campaigns(["c1", "c2"])
+
+        assert mock_batch_get.call_count == 2
+        assert (
+            mock_batch_get.call_args_list[1].kwargs["RequestItems"] == unprocessed
+        )
+        assert set(result) == {"c1", "c2"}
+
+    @pytest.mark.asyncio
+    async def test_batch_get_deduplicates_ids_and_omits_missing(self):
+        """Test that duplicate IDs collapse and absent campaigns are omitted"""
+        client, mock_batch_get = self._connected_client()
+        mock_batch_get.return_value = {
+            "Responses": {client.campaigns_table: [self._item("c1")]}
+        }
+
+        result = await client.batch_get_campaigns(["c1", "c1", "missing"])
+
+        keys = mock_batch_get.call_args.kwargs["RequestItems"][client.campaigns_table]["Keys"]
+        assert len(keys) == 2
+        assert result == {"c1": result["c1"]}
@@ -0,0 +1,101 @@
+"""
+Unit tests for the library hot-reload watcher.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from agenteval import hot_reload
+
+
+def _fake_awatch(*change_batches):
+    """Build an awatch stand-in yielding the given change sets, then ending"""
+
+    async def awatch(*paths):
+        for batch in change_batches:
+            yield batch
+
+    return awatch
+
+
+class TestLibraryReloaders:
+    """Test suite for the path-to-reloader mapping"""
+
+    def test_maps_all_three_libraries(self):
+        """Test that persona, attack and metric libraries are all watched"""
+        reloaders = hot_reload._library_reloaders()
+
+        assert len(reloaders) == 3
+        assert all(isinstance(path, Path) for path in reloaders)
+        assert all(callable(fn) for fn in reloaders.values())
+
+
+class TestWatchLibraries:
+    """Test suite for the watch loop"""
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_watchfiles(self, monkeypatch):
+        """Test that the watcher no-ops when watchfiles is unavailable"""
+        monkeypatch.setattr(hot_reload, "WATCHFILES_AVAILABLE", False)
+        reloaders = MagicMock()
+        monkeypatch.setattr(hot_reload, "_library_reloaders", reloaders)
+
+        await hot_reload.watch_libraries()
+
+        reloaders.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_when_no_library_files_exist(self, monkeypatch, tmp_path):
+        """Test that the watcher no-ops when no watched file exists on disk"""
+        missing = tmp_path / "personas.yaml"
+        monkeypatch.setattr(
+            hot_reload, "_library_reloaders", lambda: {missing: MagicMock()}
+        )
+        awatch = MagicMock()
+        monkeypatch.setattr(hot_reload, "awatch", awatch)
+
+        await hot_reload.watch_libraries()
+
+        awatch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dispatches_reload_for_changed_file(self, monkeypatch, tmp_path):
+        """Test that a change event reloads only the matching library"""
+        changed = (tmp_path / "personas.yaml").resolve()
+        changed.write_text("personas: []\n")
+        untouched = (tmp_path / "attacks.yaml").resolve()
+        untouched.write_text("attacks: []\n")
+
+        reload_changed = MagicMock()
+        reload_untouched = MagicMock()
+        monkeypatch.setattr(
+            hot_reload,
+            "_library_reloaders",
+            lambda: {changed: reload_changed, untouched: reload_untouched},
+        )
+        monkeypatch.setattr(hot_reload, "awatch", _fake_awatch({(2, str(changed))}))
+
+        await hot_reload.watch_libraries()
+
+        reload_changed.assert_called_once()
+        reload_untouched.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reload_failure_does_not_stop_watcher(self, monkeypatch, tmp_path):
+        """Test that a failing reload is logged and the loop continues"""
+        changed = (tmp_path / "metrics.yaml").resolve()
+        changed.write_text("metrics: []\n")
+
+        reload_fn = MagicMock(side_effect=RuntimeError("bad yaml"))
+        monkeypatch.setattr(hot_reload, "_library_reloaders", lambda: {changed: reload_fn})
+        monkeypatch.setattr(
+            hot_reload,
+            "awatch",
+            _fake_awatch({(2, str(changed))}, {(2, str(changed))}),
+        )
+
+        await hot_reload.watch_libraries()
+
+        assert reload_fn.call_count == 2